@@ -2,48 +2,231 @@
 Centralized logging configuration for the MCP server.
 """
 import os
+import queue
+import atexit
 import logging
+import threading
+import time
+import logging.handlers
 from pathlib import Path
+from typing import Dict, Optional
 
-def setup_logging(name: str) -> logging.Logger:
+# Our format string only uses asctime, name, levelname and message, so skip
+# collecting the thread/process details and the caller's stack frame for every
+# record. Tradeoff: %(threadName)s, %(processName)s, %(funcName)s, %(lineno)d
+# and %(filename)s are no longer populated in this process.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
+# Log location under the project root (parent of mcp_server), created once at import
+_LOG_DIR = Path(__file__).parent.parent / "logs"
+_LOG_FILE = _LOG_DIR / "mcp_server.log"
+_LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+# Seconds between forced flushes of the buffered file handler
+FLUSH_INTERVAL = 1.0
+
+# Size of the write buffer behind the log file stream
+FILE_BUFFER_SIZE = 64 * 1024
+
+# Queue every configured logger enqueues its records on
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+
+# Background listener that owns the real handlers, started on first use
+_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+# Console handler shared by every logger that logs to the console
+_CONSOLE_HANDLER: Optional[logging.StreamHandler] = None
+
+# Loggers already configured by setup_logging, keyed by name
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+# File handlers shared by every logger writing to the same file, keyed by path
+_FILE_HANDLERS: Dict[Path, "BufferedFileHandler"] = {}
+
+# MemoryHandlers batching writes to each file handler, keyed by the same path
+_BUFFERED_HANDLERS: Dict[Path, logging.handlers.MemoryHandler] = {}
+
+# Set on shutdown to stop the periodic flush thread
+_FLUSH_STOP = threading.Event()
+
+# Log line format shared by all handlers
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the date/time prefix once per second"""
+
+    def __init__(self, fmt: str):
+        super().__init__(fmt)
+        self._cached_time = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        second = int(record.created)
+        cached_second, prefix = self._cached_time
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_time = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler whose stream uses a large write buffer instead of line buffering"""
+
+    def __init__(self, filename: Path, mode: str = 'a'):
+        super().__init__(filename, mode=mode, encoding='utf-8', delay=True)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=FILE_BUFFER_SIZE, encoding=self.encoding)
+
+def _get_buffered_handler(log_file: Path) -> logging.handlers.MemoryHandler:
+    """Get the process-wide buffered handler for log_file, creating it on first use"""
+    buffered_handler = _BUFFERED_HANDLERS.get(log_file)
+    if buffered_handler is None:
+        file_handler = BufferedFileHandler(log_file)
+        file_handler.setFormatter(CachedTimeFormatter(LOG_FORMAT))
+        _FILE_HANDLERS[log_file] = file_handler
+        # Coalesce file writes; flush on ERROR, on close, or every FLUSH_INTERVAL
+        buffered_handler = _routed(logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        ))
+        if not _BUFFERED_HANDLERS:
+            threading.Thread(target=_flush_periodically, name="log-flush", daemon=True).start()
+        _BUFFERED_HANDLERS[log_file] = buffered_handler
+    return buffered_handler
+
+def _flush_periodically() -> None:
+    """Flush the buffered handlers every FLUSH_INTERVAL so records don't sit in memory"""
+    while not _FLUSH_STOP.wait(FLUSH_INTERVAL):
+        for log_file, buffered_handler in list(_BUFFERED_HANDLERS.items()):
+            buffered_handler.flush()
+            _FILE_HANDLERS[log_file].flush()
+
+class LoggerLevelFilter(logging.Filter):
+    """Filter passing records only from the loggers routed to a shared handler, each at its own level"""
+
+    def __init__(self):
+        super().__init__()
+        self.levels: Dict[str, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        level = self.levels.get(record.name)
+        return level is not None and record.levelno >= level
+
+def _routed(handler: logging.Handler) -> logging.Handler:
+    """Give handler a LoggerLevelFilter, so only the loggers routed to it reach it"""
+    handler.addFilter(LoggerLevelFilter())
+    return handler
+
+def _route(handler: logging.Handler, name: str, level: int) -> None:
+    """Pass records from the named logger at or above level to handler"""
+    handler.filters[0].levels[name] = level
+
+def _get_console_handler() -> logging.StreamHandler:
+    """Get the process-wide console handler, creating it on first use"""
+    global _CONSOLE_HANDLER
+    if _CONSOLE_HANDLER is None:
+        _CONSOLE_HANDLER = _routed(logging.StreamHandler())
+        _CONSOLE_HANDLER.setFormatter(CachedTimeFormatter(LOG_FORMAT))
+    return _CONSOLE_HANDLER
+
+def _add_to_listener(handler: logging.Handler) -> None:
+    """Hand handler to the process-wide listener, starting it on first use"""
+    global _LISTENER
+    if _LISTENER is None:
+        _LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, handler, respect_handler_level=True)
+        _LISTENER.start()
+    elif handler not in _LISTENER.handlers:
+        # The listener reads its handlers tuple per record, so swapping it is safe
+        _LISTENER.handlers = _LISTENER.handlers + (handler,)
+
+def _stop_listener() -> None:
+    """Drain the listener's queue on interpreter shutdown, then close its handlers to flush buffers"""
+    global _LISTENER
+    _FLUSH_STOP.set()
+    if _LISTENER is None:
+        return
+    _LISTENER.stop()
+    _LISTENER = None
+    # Each buffer and file is closed once, however many loggers shared it
+    for buffered_handler in _BUFFERED_HANDLERS.values():
+        buffered_handler.close()
+    for file_handler in _FILE_HANDLERS.values():
+        file_handler.close()
+
+atexit.register(_stop_listener)
+
+def setup_logging(
+    name: str,
+    *,
+    log_dir: Path = _LOG_DIR,
+    with_console: bool = True,
+    file_level: int = logging.DEBUG,
+    console_level: int = logging.INFO
+) -> logging.Logger:
     """
     Set up logging configuration for the given module name.
     Returns a configured logger instance.
+
+    Args:
+        name: Logger name, usually the calling module's __name__
+        log_dir: Directory holding mcp_server.log
+        with_console: Whether to also log to the console
+        file_level: Minimum level written to the log file
+        console_level: Minimum level written to the console
+
+    Records are enqueued on the caller thread and written to the file and
+    console handlers by a single background QueueListener shared by every
+    logger, so logging never blocks on disk I/O in the hot path. File output
+    is additionally batched through a MemoryHandler; console output stays
+    unbuffered.
+
+    Loggers are configured once per name; later calls return the cached logger
+    regardless of the options passed. Set the MCP_DISABLE_LOGS environment
+    variable to disable them entirely.
     """
-    # Get project root directory (parent of mcp_server)
-    project_root = Path(__file__).parent.parent
-    log_dir = project_root / "logs"
-    
-    # Create logs directory if it doesn't exist
-    os.makedirs(log_dir, exist_ok=True)
-    
-    log_file = log_dir / "mcp_server.log"
-
-    # Create formatter
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-
-    # Create file handler
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(formatter)
-    file_handler.setLevel(logging.DEBUG)  # Set file to DEBUG level for detailed logs
-
-    # Create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    console_handler.setLevel(logging.INFO)  # Set console to INFO level
+    if name in _LOGGERS:
+        return _LOGGERS[name]
+
+    # Setting MCP_DISABLE_LOGS turns logging off entirely, without building handlers
+    if os.environ.get("MCP_DISABLE_LOGS"):
+        logger = logging.getLogger(name)
+        logger.disabled = True
+        logger.propagate = False
+        _LOGGERS[name] = logger
+        return logger
+
+    # Reuse the process-wide buffered file handler (the file opens lazily on
+    # the first record), at this logger's file level
+    if log_dir != _LOG_DIR:
+        log_dir.mkdir(parents=True, exist_ok=True)
+    buffered_handler = _get_buffered_handler(log_dir / _LOG_FILE.name)
+    _route(buffered_handler, name, file_level)
+    _add_to_listener(buffered_handler)
+    level = file_level
+
+    # Share the console handler, at this logger's console level
+    if with_console:
+        console_handler = _get_console_handler()
+        _route(console_handler, name, console_level)
+        _add_to_listener(console_handler)
+        level = min(level, console_level)
 
     # Get logger
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-    
+    logger.setLevel(level)
+
     # Prevent propagation to root logger
     logger.propagate = False
-    
+
     # Remove any existing handlers to avoid duplicates
     logger.handlers = []
-    
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
 
-    return logger 
\ No newline at end of file
+    # Only the non-blocking queue handler is attached to the logger
+    logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+
+    _LOGGERS[name] = logger
+    return logger
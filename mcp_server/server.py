@@ -3,9 +3,12 @@ Primary MCP server entry point.
 Registers all necessary tools and runs the server.
 """
 import sys
+import atexit
 import logging
 import asyncio
-from typing import Optional
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
 
 # Completely disable all logging before importing anything else
 logging.getLogger().setLevel(logging.CRITICAL)
@@ -17,17 +20,73 @@ logging.getLogger().addHandler(logging.NullHandler())
 from mcp.server.fastmcp import FastMCP
 from mcp_server.tools.research_engine import (
     deep_research,
+    prewarm_browsers,
+    close_browsers,
     BrowserApproach,
     ResearchConfig,
     ResearchSite
 )
 
-def log_to_stderr(message: str) -> None:
-    """Log a message to stderr that will be captured by MCP."""
-    print(message, file=sys.stderr, flush=True)
+class StderrLogger:
+    """
+    Buffered writer for messages to stderr that will be captured by MCP.
+    Messages are batched and written when the buffer grows past max_chars,
+    when the flush timer fires, or when flush() is called explicitly.
+    """
+
+    def __init__(self, max_chars: int = 4096, flush_interval: float = 0.5):
+        self.max_chars = max_chars
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._size = 0
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def __call__(self, message: str) -> None:
+        """Queue a message for stderr"""
+        with self._lock:
+            self._buffer.append(message + "\n")
+            self._size += len(message) + 1
+            should_flush = self._size > self.max_chars
+            if not should_flush and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered messages to stderr"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            data = "".join(self._buffer)
+            self._buffer.clear()
+            self._size = 0
+        if data:
+            sys.stderr.write(data)
+            sys.stderr.flush()
+
+log_to_stderr = StderrLogger()
+atexit.register(log_to_stderr.flush)
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Launch pooled browsers in the background while the server starts up"""
+    prewarm = asyncio.create_task(prewarm_browsers())
+    try:
+        yield
+    finally:
+        prewarm.cancel()
+        try:
+            await prewarm
+        except asyncio.CancelledError:
+            pass
+        await close_browsers()
 
 # Initialize FastMCP server
-mcp = FastMCP("SuperDeepResearch")
+mcp = FastMCP("SuperDeepResearch", lifespan=lifespan)
 
 async def research_tool(
     query: str,
@@ -58,15 +117,17 @@ async def research_tool(
         return result
     except Exception as e:
         log_to_stderr(f"Research failed: {str(e)}")
+        log_to_stderr.flush()
         raise
 
 # Register the research tool
 try:
-    log_to_stderr("Registering research tool...")
-    mcp.tool()(research_tool)
-    log_to_stderr("Successfully registered research tool")
+    register_tool = mcp.tool()
+    register_tool(research_tool)
+    log_to_stderr("Registered research tool")
 except Exception as e:
     log_to_stderr(f"Error: Failed to register tool: {str(e)}")
+    log_to_stderr.flush()
     raise
 
 def activate_mcp_server(host: str = "0.0.0.0", port: int = 8000):
@@ -77,6 +138,7 @@ def activate_mcp_server(host: str = "0.0.0.0", port: int = 8000):
         log_to_stderr("MCP server running")
     except Exception as e:
         log_to_stderr(f"Error: {str(e)}")
+        log_to_stderr.flush()
         raise
 
 if __name__ == "__main__":
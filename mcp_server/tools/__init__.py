@@ -2,10 +2,19 @@
 MCP Server tools package initialization.
 """
 
-from .research_engine import deep_research, BrowserApproach, ResearchConfig, ResearchSite
+from .research_engine import (
+    deep_research,
+    prewarm_browsers,
+    close_browsers,
+    BrowserApproach,
+    ResearchConfig,
+    ResearchSite
+)
 
 __all__ = [
     "deep_research",
+    "prewarm_browsers",
+    "close_browsers",
     "BrowserApproach",
     "ResearchConfig",
     "ResearchSite"
@@ -5,39 +5,59 @@ Main orchestrator for executing deep research across different AI research sites
 using various browser automation approaches.
 """
 import sys
+import time
+import random
+import hashlib
 import logging
 import asyncio
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from enum import Enum
+from types import MappingProxyType
 from dataclasses import dataclass
 
 from ..logging_config import setup_logging
 
 # Set up logging
-logger = setup_logging(__name__)
-logger.setLevel(logging.INFO)
-
-# Create console handler with formatting
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
+logger = setup_logging(__name__, file_level=logging.INFO)
 
 # Now import other modules
-from langchain_openai import ChatOpenAI
-from browser_use import Agent, BrowserConfig, Browser, BrowserContextConfig
 from .research_scrapers import (
     ScraperConfig,
     ResearchSite,
+    BaseResearchScraper,
     BrowserUseDriver,
     NoDriverDriver,
-    PatchrightDriver
+    PatchrightDriver,
+    patchright_pool,
+    browser_use_pool,
+    close_http_client
 )
+from .research_scrapers.core.config import DEFAULT_POOL_SIZE, DEFAULT_RESULT_CACHE_TTL, PERSISTENT_PROFILES
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Errors that fail the same way on every attempt, so they are raised immediately
+TERMINAL_ERRORS = (ValueError, KeyError)
+
+# Upper bound in seconds for the backoff between retries
+MAX_RETRY_DELAY = 30
+
+# Research results keyed by (site, query digest), holding (time stored, result)
+_RESULT_CACHE: Dict[Tuple[ResearchSite, str], Tuple[float, str]] = {}
+
+def _result_key(site: ResearchSite, query: str) -> Tuple[ResearchSite, str]:
+    """Key under which a query's result is cached"""
+    return (site, hashlib.blake2b(query.encode(), digest_size=16).hexdigest())
+
+def _cached_result(key: Tuple[ResearchSite, str], ttl: float) -> Optional[str]:
+    """Get a cached result that is still fresh, dropping expired entries"""
+    now = time.monotonic()
+    for stale in [k for k, (stored, _) in _RESULT_CACHE.items() if now - stored >= ttl]:
+        del _RESULT_CACHE[stale]
+    entry = _RESULT_CACHE.get(key)
+    return entry[1] if entry else None
+
 class BrowserApproach(str, Enum):
     BROWSER_USE = "browser_use"
     NODRIVER = "nodriver"
@@ -53,6 +73,42 @@ class ResearchConfig:
     max_steps: int = 5
     max_retries: int = 3
     site: ResearchSite = ResearchSite.GEMINI
+    result_cache_ttl: float = DEFAULT_RESULT_CACHE_TTL  # Seconds to reuse a result; 0 disables
+
+async def prewarm_browsers(count: int = DEFAULT_POOL_SIZE, headless: bool = True) -> None:
+    """
+    Launch pooled Patchright browsers ahead of the first request.
+    Defaults to BROWSER_POOL_SIZE browsers; 0 disables prewarming. Skipped
+    when BROWSER_PERSISTENT_PROFILES is set, since requests then open their
+    pages in a persistent profile instead of a pooled browser.
+    """
+    if PERSISTENT_PROFILES:
+        logger.info("Persistent profiles enabled; skipping browser prewarm")
+        return
+    await patchright_pool.prewarm(headless, count)
+
+async def close_browsers() -> None:
+    """Close every pooled browser and the shared LLM HTTP client"""
+    await asyncio.gather(
+        patchright_pool.close(),
+        browser_use_pool.close(),
+        close_http_client()
+    )
+
+async def prepare_driver(driver: BaseResearchScraper) -> None:
+    """
+    Launch the driver's browser while its login prerequisites are prepared.
+    Both steps always run to completion before any error is raised, so
+    cleanup never races a half-finished setup.
+    """
+    results = await asyncio.gather(
+        driver.setup(),
+        driver.prepare_login_credentials(),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
 async def browse_with_browser_use(query: str, config: ResearchConfig) -> str:
     """Execute research using browser-use library"""
@@ -64,7 +120,7 @@ async def browse_with_browser_use(query: str, config: ResearchConfig) -> str:
     ))
     
     try:
-        await driver.setup()
+        await prepare_driver(driver)
         await driver.login()
         result = await driver.execute_research(query)
         return result
@@ -80,7 +136,7 @@ async def browse_with_nodriver(query: str, config: ResearchConfig) -> str:
     ))
     
     try:
-        await driver.setup()
+        await prepare_driver(driver)
         await driver.login()
         result = await driver.execute_research(query)
         return result
@@ -89,7 +145,7 @@ async def browse_with_nodriver(query: str, config: ResearchConfig) -> str:
 
 async def browse_with_patchright(query: str, config: ResearchConfig) -> str:
     """Execute research using Patchright automation"""
-    logger.info(f"Starting Patchright research for site: {config.site}")
+    logger.info("Starting Patchright research for site: %s", config.site)
     
     driver = PatchrightDriver(ScraperConfig(
         headless=config.headless,
@@ -99,7 +155,7 @@ async def browse_with_patchright(query: str, config: ResearchConfig) -> str:
     
     try:
         logger.info("Setting up browser...")
-        await driver.setup()
+        await prepare_driver(driver)
         logger.info("Browser setup complete")
         
         logger.info("Attempting login...")
@@ -111,13 +167,20 @@ async def browse_with_patchright(query: str, config: ResearchConfig) -> str:
         logger.info("Research complete")
         return result
     except Exception as e:
-        logger.error(f"Research failed: {str(e)}")
+        logger.error("Research failed: %s", e)
         raise
     finally:
         logger.info("Cleaning up browser resources...")
         await driver.cleanup()
         logger.info("Cleanup complete")
 
+# Dispatch table from browser approach to its research function
+APPROACH_MAP = MappingProxyType({
+    BrowserApproach.BROWSER_USE: browse_with_browser_use,
+    BrowserApproach.NODRIVER: browse_with_nodriver,
+    BrowserApproach.PATCHRIGHT: browse_with_patchright,
+})
+
 async def deep_research(
     plan: str,
     approach: BrowserApproach = BrowserApproach.PATCHRIGHT,
@@ -142,28 +205,38 @@ async def deep_research(
     else:
         config.site = site
     
-    approach_map = {
-        BrowserApproach.BROWSER_USE: browse_with_browser_use,
-        BrowserApproach.NODRIVER: browse_with_nodriver,
-        BrowserApproach.PATCHRIGHT: browse_with_patchright,
-    }
+    research_func = APPROACH_MAP[approach]
     
-    research_func = approach_map[approach]
+    # The same query on the same site gives the same answer for a while, so
+    # a repeat skips the browser and LLM work entirely
+    cache_key = _result_key(site, plan)
+    if config.result_cache_ttl > 0:
+        cached = _cached_result(cache_key, config.result_cache_ttl)
+        if cached is not None:
+            logger.info("Returning cached result for %s query", site.value)
+            return cached
     
     for attempt in range(config.max_retries):
         try:
             if attempt > 0:
-                logger.info(f"Retry attempt {attempt + 1}/{config.max_retries}")
-                # Add increasing delay between retries
-                delay = attempt * 2
-                logger.info(f"Waiting {delay} seconds before retry...")
-                await asyncio.sleep(delay)
-            return await research_func(plan, config)
+                logger.info("Retry attempt %d/%d", attempt + 1, config.max_retries)
+            result = await research_func(plan, config)
+            if config.result_cache_ttl > 0:
+                _RESULT_CACHE[cache_key] = (time.monotonic(), result)
+            return result
+        except TERMINAL_ERRORS as e:
+            # Configuration/credential problems won't fix themselves on retry
+            logger.error("Attempt %d failed with non-retryable error: %s", attempt + 1, e)
+            raise
         except Exception as e:
-            logger.error(f"Attempt {attempt + 1} failed: {str(e)}")
+            # Includes scrapers finding no results, which may succeed on retry
+            logger.error("Attempt %d failed: %s", attempt + 1, e)
             if attempt == config.max_retries - 1:
                 logger.error("Max retries reached, giving up.")
                 raise
-            logger.warning(f"Will retry in {(attempt + 1) * 2} seconds...")
+            # Capped exponential backoff with jitter: 1, 2, 4, ... + U(0, 1)
+            delay = min(MAX_RETRY_DELAY, 2 ** attempt) + random.random()
+            logger.warning("Will retry in %.1f seconds...", delay)
+            await asyncio.sleep(delay)
 
 # Basic configuration
@@ -6,7 +6,11 @@ from .core.auth import GeminiAuth
 from .drivers import (
     BrowserUseDriver,
     NoDriverDriver,
-    PatchrightDriver
+    PatchrightDriver,
+    BrowserPool,
+    patchright_pool,
+    browser_use_pool,
+    close_http_client
 )
 
 __all__ = [
@@ -16,5 +20,9 @@ __all__ = [
     'GeminiAuth',
     'BrowserUseDriver',
     'NoDriverDriver',
-    'PatchrightDriver'
+    'PatchrightDriver',
+    'BrowserPool',
+    'patchright_pool',
+    'browser_use_pool',
+    'close_http_client'
 ] 
\ No newline at end of file
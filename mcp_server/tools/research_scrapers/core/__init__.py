@@ -1,10 +1,11 @@
 """Core abstractions and shared utilities for research scrapers."""
 
-from .base import BaseResearchScraper
+from .base import BackgroundLaunchMixin, BaseResearchScraper
 from .auth import GeminiAuth
 from .config import ScraperConfig, ResearchSite, SiteConfig, SITE_CONFIGS
 
 __all__ = [
+    'BackgroundLaunchMixin',
     'BaseResearchScraper',
     'GeminiAuth',
     'ScraperConfig',
@@ -1,13 +1,33 @@
 """Authentication module for Gemini scraping."""
+import os
+import hmac
+import time
+import base64
+import struct
 import asyncio
+import hashlib
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
 from .config import ScraperConfig
 
+# Errors that mean no 2FA prompt was shown, as opposed to a bug in the flow
+_NO_2FA_PROMPT_ERRORS = (TimeoutError, asyncio.TimeoutError, LookupError)
+
+def _totp(secret: str, period: int = 30, digits: int = 6) -> str:
+    """Generate the current RFC 6238 TOTP code for a base32 secret"""
+    key = base64.b32decode(secret.replace(" ", "").upper() + "=" * (-len(secret) % 8))
+    counter = struct.pack(">Q", int(time.time()) // period)
+    digest = hmac.new(key, counter, hashlib.sha1).digest()
+    offset = digest[-1] & 0x0F
+    code = struct.unpack(">I", digest[offset:offset + 4])[0] & 0x7FFFFFFF
+    return str(code % 10 ** digits).zfill(digits)
+
 class GeminiAuth(ABC):
     """Base class for Gemini authentication across different browser implementations"""
     
+    __slots__ = ('config', '_2fa_code')
+    
     def __init__(self, config: ScraperConfig):
         self.config = config
         self._2fa_code: Optional[str] = None
@@ -37,22 +57,45 @@ class GeminiAuth(ABC):
         """Verify successful login"""
         pass
     
+    async def is_logged_in(self) -> bool:
+        """
+        Check whether the page already shows a signed-in session, e.g. from a
+        persistent profile. Implementations that can't tell return False.
+        """
+        return False
+    
+    async def _prefetch_2fa_code(self) -> None:
+        """Resolve the 2FA code from GOOGLE_2FA_SECRET if none was set explicitly"""
+        if not self._2fa_code:
+            secret = os.getenv("GOOGLE_2FA_SECRET")
+            if secret:
+                self._2fa_code = _totp(secret)
+    
+    async def _login_steps(self) -> bool:
+        """Run the login steps in order, overlapping independent work"""
+        if await self.is_logged_in():
+            return True
+        
+        await self.navigate_to_login()
+        await self.enter_email()
+        
+        # The 2FA code doesn't depend on the page, so resolve it while the
+        # password is being entered
+        await asyncio.gather(self.enter_password(), self._prefetch_2fa_code())
+        
+        # Check if 2FA is needed
+        try:
+            await self.handle_2fa()
+        except _NO_2FA_PROMPT_ERRORS:
+            # If no 2FA prompt found, continue
+            pass
+        
+        return await self.verify_login_success()
+    
     async def login(self) -> bool:
-        """Execute full login flow"""
+        """Execute full login flow, bounded by the configured login timeout"""
         try:
-            await self.navigate_to_login()
-            await self.enter_email()
-            await asyncio.sleep(1)  # Brief pause for animation
-            await self.enter_password()
-            
-            # Check if 2FA is needed
-            try:
-                await self.handle_2fa()
-            except Exception as e:
-                # If no 2FA prompt found, continue
-                pass
-            
-            return await self.verify_login_success()
+            return await asyncio.wait_for(self._login_steps(), timeout=self.config.login_timeout)
         except Exception as e:
             raise Exception(f"Login failed: {str(e)}")
     
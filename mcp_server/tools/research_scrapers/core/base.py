@@ -1,6 +1,7 @@
 """Base module for research site scraping implementations."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 
 from .config import ScraperConfig, ResearchSite
 from .auth import GeminiAuth
@@ -8,6 +9,8 @@ from .auth import GeminiAuth
 class BaseResearchScraper(ABC):
     """Base class for all research site scraper implementations"""
     
+    __slots__ = ('config', '_auth', '_site_handlers')
+    
     def __init__(self, config: Optional[ScraperConfig] = None):
         self.config = config or ScraperConfig()
         self._auth: Optional[GeminiAuth] = None
@@ -34,6 +37,29 @@ class BaseResearchScraper(ABC):
         """Execute research query and return results"""
         pass
     
+    async def stream_research(self, query: str) -> AsyncIterator[str]:
+        """
+        Execute research query, yielding the response in chunks as it arrives.
+        Drivers that can't stream yield the full result once.
+        """
+        yield await self.execute_research(query)
+    
+    async def execute_research_batch(self, queries: List[str]) -> List[str]:
+        """
+        Execute several research queries, returning results in query order.
+        Drivers that can't run queries side by side run them one at a time.
+        """
+        return [await self.execute_research(query) for query in queries]
+    
+    async def prepare_login_credentials(self) -> None:
+        """
+        Prepare everything login needs that doesn't require the browser.
+        Runs concurrently with setup(), so it must not touch the page.
+        """
+        site_config = self.config.site_config
+        if site_config.requires_auth and not (self.config.google_email and self.config.google_password):
+            raise ValueError(f"Credentials are required to log in to {self.config.site.value}")
+    
     async def login(self) -> bool:
         """Execute login flow using auth handler if required"""
         if not self.auth:
@@ -48,4 +74,41 @@ class BaseResearchScraper(ABC):
     @abstractmethod
     async def handle_site_specific_research(self, site: ResearchSite, query: str) -> str:
         """Handle research for a specific site"""
-        pass 
\ No newline at end of file
+        pass 
+
+class BackgroundLaunchMixin(ABC):
+    """
+    Mixin for drivers whose setup() starts the browser launch in the
+    background, so it overlaps other setup work; research methods wait for
+    it with _ensure_browser_ready(). Drivers using it declare a
+    '_browser_task' slot.
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._browser_task: Optional[asyncio.Task] = None
+    
+    @abstractmethod
+    async def _launch_browser(self) -> None:
+        """Launch the browser"""
+        pass
+    
+    def _ensure_browser_task(self) -> None:
+        """Start launching the browser in the background if not already started"""
+        if self._browser_task is None:
+            self._browser_task = asyncio.create_task(self._launch_browser())
+    
+    async def _ensure_browser_ready(self) -> None:
+        """Wait for the background launch, raising its error if it failed"""
+        self._ensure_browser_task()
+        try:
+            await self._browser_task
+        except Exception as e:
+            raise RuntimeError(f"Browser launch failed: {str(e)}") from e
+    
+    async def _settle_browser_task(self) -> None:
+        """Let an in-flight launch finish so cleanup sees everything it started"""
+        if self._browser_task is not None:
+            await asyncio.gather(self._browser_task, return_exceptions=True)
@@ -1,9 +1,70 @@
 """Configuration module for research site scraping."""
 import os
-from dataclasses import dataclass
+import hashlib
+from dataclasses import dataclass, field
 from typing import Dict, Tuple, Optional, Any
 from enum import Enum
 
+# Directory holding the persistent Chrome profiles, one per Google account
+PROFILE_ROOT = os.path.expanduser("~/.cache/superdeepresearch")
+
+# Whether scrapers default to a persistent Chrome profile under PROFILE_ROOT;
+# off by default, so Patchright uses its pre-launched browser pool
+PERSISTENT_PROFILES = bool(os.getenv("BROWSER_PERSISTENT_PROFILES"))
+
+# Idle browsers kept per pool key, and launched at server startup
+DEFAULT_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+
+# Requests a pooled browser serves before it is replaced with a fresh one
+DEFAULT_MAX_USES_PER_INSTANCE = int(os.getenv("BROWSER_MAX_USES", "20"))
+
+# Tabs a browser context may have open for research at once
+DEFAULT_MAX_TABS = int(os.getenv("BROWSER_MAX_TABS", "4"))
+
+# Seconds a research result is reused for the same site and query; 0 disables
+DEFAULT_RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "1800"))
+
+# Chromium flags that skip features a scripted scraper never uses, cutting
+# launch time and memory per browser
+FAST_CHROME_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-breakpad',
+    '--disable-client-side-phishing-detection',
+    '--disable-default-apps',
+    '--disable-hang-monitor',
+    '--disable-popup-blocking',
+    '--disable-prompt-on-repost',
+    '--disable-sync',
+    '--disable-translate',
+    '--metrics-recording-only',
+    '--no-first-run',
+    '--safebrowsing-disable-auto-update',
+    '--password-store=basic',
+    '--use-mock-keychain',
+    '--mute-audio',
+)
+
+# Minimal flags used when fast_chrome_args is turned off for debugging
+BASE_CHROME_ARGS = ('--no-sandbox', '--disable-dev-shm-usage')
+
+# URL patterns for images, fonts, media and trackers, none of which the
+# text scrape needs; blocking them cuts page-load bandwidth
+BLOCKED_URL_PATTERNS = (
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf',
+    '*.mp4', '*.webm',
+    '*googletagmanager*', '*doubleclick*', '*google-analytics*',
+)
+
+# The same block list for drivers that route requests by regular expression:
+# file extensions, and tracker hosts matched anywhere in the URL
+BLOCKED_EXTENSIONS = ('png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'woff', 'woff2', 'ttf', 'mp4', 'webm')
+BLOCKED_HOSTS = ('googletagmanager', 'doubleclick', 'google-analytics')
+
 class ResearchSite(str, Enum):
     GEMINI = "gemini"
     PERPLEXITY = "perplexity"
@@ -37,14 +98,26 @@ SITE_CONFIGS = {
     )
 }
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScraperConfig:
-    """Shared configuration for all scraper implementations"""
+    """
+    Shared configuration for all scraper implementations.
+    Immutable and hashable; derived values are computed once in __post_init__.
+    """
     # Browser settings
     headless: bool = True
     window_size: Tuple[int, int] = (1920, 1080)
     network_idle_timeout: float = 3.0
     max_retries: int = 3
+    login_timeout: float = 60.0  # Upper bound in seconds for the whole login flow
+    
+    # Browser pooling
+    pool_size: int = DEFAULT_POOL_SIZE
+    max_uses_per_instance: int = DEFAULT_MAX_USES_PER_INSTANCE
+    fast_chrome_args: bool = True  # Turn off to launch Chrome with its default features
+    block_resources: bool = True  # Skip loading BLOCKED_URL_PATTERNS
+    max_tabs: int = DEFAULT_MAX_TABS  # Tabs open at once in a shared context
+    disable_playwright_stack_trace: bool = True  # Skip Patchright's per-call stack capture
     
     # Site selection
     site: ResearchSite = ResearchSite.GEMINI
@@ -53,28 +126,65 @@ class ScraperConfig:
     google_email: Optional[str] = None
     google_password: Optional[str] = None
     
+    # Chrome profile kept between runs so the Google session and HTTP cache
+    # survive. Unset by default; with BROWSER_PERSISTENT_PROFILES set it
+    # defaults to a per-account directory under PROFILE_ROOT, or a per-site
+    # one without an account. Pass "" for a throwaway profile regardless.
+    user_data_dir: Optional[str] = None
+    
+    # Cookies and local storage saved after a login, so pooled Patchright
+    # browsers start signed in; defaults to a file beside the profiles when
+    # there is no persistent profile, which keeps its own cookies. Pass ""
+    # to log in afresh every time.
+    storage_state_path: Optional[str] = None
+    
+    # Derived values, precomputed in __post_init__
+    _site_config: SiteConfig = field(init=False, repr=False, compare=False)
+    _viewport: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _window_size_str: str = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
-        """Load credentials from environment if not provided"""
-        if self.site == ResearchSite.GEMINI:
+        """Load credentials from environment if not provided and precompute derived values"""
+        # Normalize plain strings to the enum member so sites can be compared with `is`
+        object.__setattr__(self, "site", ResearchSite(self.site))
+        
+        if self.site is ResearchSite.GEMINI:
             if not self.google_email:
-                self.google_email = os.getenv("GOOGLE_EMAIL")
+                object.__setattr__(self, "google_email", os.getenv("GOOGLE_EMAIL"))
             if not self.google_password:
-                self.google_password = os.getenv("GOOGLE_PASSWORD")
+                object.__setattr__(self, "google_password", os.getenv("GOOGLE_PASSWORD"))
             
             if not self.google_email or not self.google_password:
                 raise ValueError("Google credentials must be provided via constructor or environment variables")
+        
+        account = hashlib.sha1(self.google_email.encode()).hexdigest()[:12] if self.google_email else None
+        if self.user_data_dir is None and PERSISTENT_PROFILES:
+            profile = f"chrome-profile-{account}" if account else f"profile-{self.site.value}"
+            object.__setattr__(self, "user_data_dir", os.path.join(PROFILE_ROOT, profile))
+        if self.storage_state_path is None and not self.user_data_dir:
+            name = account or self.site.value
+            object.__setattr__(self, "storage_state_path", os.path.join(PROFILE_ROOT, f"storage-state-{name}.json"))
+        
+        object.__setattr__(self, "_site_config", SITE_CONFIGS[self.site])
+        object.__setattr__(self, "_viewport", {"width": self.window_size[0], "height": self.window_size[1]})
+        object.__setattr__(self, "_window_size_str", f"{self.window_size[0]},{self.window_size[1]}")
     
     @property
     def site_config(self) -> SiteConfig:
         """Get configuration for the selected site"""
-        return SITE_CONFIGS[self.site]
+        return self._site_config
     
     @property
     def viewport(self) -> Dict[str, int]:
         """Get viewport settings in format expected by Playwright"""
-        return {"width": self.window_size[0], "height": self.window_size[1]}
+        return self._viewport
+    
+    @property
+    def chrome_args(self) -> Tuple[str, ...]:
+        """Get the Chromium flags for Browser-Use and NoDriver launches"""
+        return FAST_CHROME_ARGS if self.fast_chrome_args else BASE_CHROME_ARGS
     
     @property
     def window_size_str(self) -> str:
         """Get window size in format expected by some browser drivers"""
-        return f"{self.window_size[0]},{self.window_size[1]}" 
\ No newline at end of file
+        return self._window_size_str 
\ No newline at end of file
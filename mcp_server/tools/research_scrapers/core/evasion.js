@@ -0,0 +1,46 @@
+// Mask automation indicators
+Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
+Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+
+// Mock Chrome runtime
+window.chrome = {
+    runtime: {},
+    app: {},
+    csi: function(){},
+    loadTimes: function(){}
+};
+
+// Override permissions query
+const originalQuery = window.navigator.permissions.query;
+window.navigator.permissions.query = (parameters) => (
+    parameters.name === 'notifications' ?
+    Promise.resolve({state: Notification.permission}) :
+    originalQuery(parameters)
+);
+
+// Add WebGL support
+const getParameter = WebGLRenderingContext.getParameter;
+WebGLRenderingContext.prototype.getParameter = function(parameter) {
+    if (parameter === 37445) {
+        return 'Intel Inc.';
+    }
+    if (parameter === 37446) {
+        return 'Intel Iris OpenGL Engine';
+    }
+    return getParameter(parameter);
+};
+
+// Randomize canvas fingerprint
+const originalGetContext = HTMLCanvasElement.prototype.getContext;
+HTMLCanvasElement.prototype.getContext = function(type) {
+    const context = originalGetContext.apply(this, arguments);
+    if (type === '2d') {
+        const originalFillText = context.fillText;
+        context.fillText = function() {
+            arguments[0] = arguments[0] + ' ';
+            return originalFillText.apply(this, arguments);
+        }
+    }
+    return context;
+};
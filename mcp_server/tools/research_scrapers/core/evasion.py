@@ -0,0 +1,13 @@
+"""Browser fingerprint evasion shared by the Patchright-based scrapers."""
+from pathlib import Path
+
+def _minify(script: str) -> str:
+    """Drop comment lines, indentation and blank lines from a JS snippet"""
+    lines = (line.strip() for line in script.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+# Init script masking automation indicators in every page of a context. The
+# source lives in evasion.js; it is read and minified once at import, and
+# contexts only ship the compact form.
+EVASION_SCRIPT_PATH = Path(__file__).with_name("evasion.js")
+EVASION_SCRIPT = _minify(EVASION_SCRIPT_PATH.read_text())
@@ -0,0 +1,89 @@
+"""Event-driven page waits shared by the browser drivers."""
+import asyncio
+from typing import Any, Awaitable
+
+# Upper bound in seconds on waiting for a response that is still streaming
+STABLE_TEXT_CAP = 60.0
+
+# JS function (selector, quietMs, timeoutMs, capMs) resolving with the text of
+# the last element matching selector once it has stopped changing for quietMs.
+# timeoutMs bounds the wait for any text to appear; once it has, only capMs
+# bounds the wait, so long answers aren't cut off mid-stream. Driven by a
+# MutationObserver, so it settles as soon as the page does rather than after
+# a fixed delay.
+STABLE_TEXT_JS = """
+(selector, quietMs, timeoutMs, capMs) => new Promise(resolve => {
+    const read = () => {
+        const els = document.querySelectorAll(selector);
+        return els.length ? els[els.length - 1].innerText : '';
+    };
+    let last = null;
+    let quiet = null;
+    let deadline = null;
+    const finish = () => {
+        observer.disconnect();
+        clearTimeout(quiet);
+        clearTimeout(deadline);
+        resolve(read());
+    };
+    const check = () => {
+        const text = read();
+        if (!text || text === last) return;
+        if (last === null) {
+            clearTimeout(deadline);
+            deadline = setTimeout(finish, capMs);
+        }
+        last = text;
+        clearTimeout(quiet);
+        quiet = setTimeout(finish, quietMs);
+    };
+    const observer = new MutationObserver(check);
+    deadline = setTimeout(finish, timeoutMs);
+    observer.observe(document.body, {subtree: true, childList: true, characterData: true});
+    check();
+})
+"""
+
+async def first_found(*lookups: Awaitable[Any]) -> Any:
+    """
+    Run element lookups or waits concurrently and return the first truthy
+    result, cancelling the rest. Ones that fail or find nothing are ignored.
+    """
+    pending = {asyncio.ensure_future(lookup) for lookup in lookups}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.cancelled() and task.exception() is None and task.result():
+                    return task.result()
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+
+async def first_visible(page: Any, selectors: Any, timeout: float) -> Any:
+    """
+    Wait on a Playwright/Patchright page for all selectors at once and return
+    (selector, element) for the first one to become visible, or None.
+    """
+    async def probe(selector: str) -> Any:
+        element = await page.wait_for_selector(selector, state='visible', timeout=timeout * 1000)
+        return (selector, element) if element else None
+    return await first_found(*(probe(selector) for selector in selectors))
+
+async def wait_for_stable_text(
+    page: Any,
+    selector: str,
+    timeout: float,
+    quiet: float = 0.75,
+    cap: float = STABLE_TEXT_CAP
+) -> str:
+    """
+    Wait on a Playwright/Patchright page for the text of the last element
+    matching selector to settle, and return it ('' if nothing appeared
+    within timeout seconds).
+    """
+    return await page.evaluate(
+        f"args => ({STABLE_TEXT_JS})(...args)",
+        [selector, int(quiet * 1000), int(timeout * 1000), int(cap * 1000)]
+    )
@@ -1,11 +1,16 @@
 """Driver implementations for research scraping."""
 
-from .browser_use import BrowserUseDriver
+from .browser_use import BrowserUseDriver, close_http_client
 from .nodriver import NoDriverDriver
 from .patchright import PatchrightDriver
+from .pool import BrowserPool, patchright_pool, browser_use_pool
 
 __all__ = [
     'BrowserUseDriver',
     'NoDriverDriver',
-    'PatchrightDriver'
+    'PatchrightDriver',
+    'BrowserPool',
+    'patchright_pool',
+    'browser_use_pool',
+    'close_http_client'
 ] 
\ No newline at end of file
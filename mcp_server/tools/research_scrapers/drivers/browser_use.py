@@ -1,23 +1,132 @@
 """Browser-Use based implementation for research scraping."""
+import re
+import json
 import logging
 import asyncio
-from typing import Optional, Any, Type
-from browser_use import Agent, BrowserConfig, Browser, BrowserContextConfig
-from langchain_openai import ChatOpenAI
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, List, Optional, Any, Tuple, Type
 
-from ..core.base import BaseResearchScraper
+from ..core.base import BackgroundLaunchMixin, BaseResearchScraper
 from ..core.auth import GeminiAuth
 from ..core.config import ScraperConfig, ResearchSite
+from ..core.waits import wait_for_stable_text
 from ....logging_config import setup_logging
 from ..sites.perplexity.scraper import PerplexitySiteInstructions
 from ..sites.gemini.scraper import GeminiSiteInstructions
+from .pool import browser_use_pool
+
+if TYPE_CHECKING:
+    import httpx
+    from browser_use import Agent
+    from langchain_openai import ChatOpenAI
 
 logger = setup_logging(__name__)
 
+# Site instructions for each research site, looked up once per driver
+_SITE_INSTRUCTIONS: Mapping[ResearchSite, Any] = MappingProxyType({
+    ResearchSite.PERPLEXITY: PerplexitySiteInstructions.BrowserUse,
+    ResearchSite.GEMINI: GeminiSiteInstructions.BrowserUse
+})
+
+# HTTP client shared by every LLM client, so all API traffic reuses one
+# keep-alive connection pool
+_HTTP_CLIENT: Optional["httpx.AsyncClient"] = None
+
+# LLM clients shared by every driver, keyed by (model, temperature)
+_LLM_CACHE: Dict[Tuple[str, float], "ChatOpenAI"] = {}
+
+def get_http_client() -> "httpx.AsyncClient":
+    """Get the shared HTTP client, creating it on first use"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        import httpx
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=120.0
+            )
+        )
+    return _HTTP_CLIENT
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and drop the LLM clients using it"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+    _LLM_CACHE.clear()
+
+def get_llm(model: str = "gpt-4", temperature: float = 0.0) -> "ChatOpenAI":
+    """Get the shared LLM client for model and temperature"""
+    key = (model, temperature)
+    if key not in _LLM_CACHE:
+        from langchain_openai import ChatOpenAI
+        _LLM_CACHE[key] = ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            http_async_client=get_http_client()
+        )
+    return _LLM_CACHE[key]
+
+# Task template fields filled in per call rather than cached: the query, and
+# the credentials, which must not stay in memory beyond the request
+_TASK_FIELDS = ("email", "password", "query")
+
+# Marks where each per-call field goes in a cached template. NUL can't occur
+# in the templates or selectors, so splitting on it is unambiguous.
+_TASK_FIELD_MARKERS = {name: f"\0{name}\0" for name in _TASK_FIELDS}
+_TASK_FIELD_SPLIT = re.compile("\0(%s)\0" % "|".join(_TASK_FIELDS))
+
+# Task templates with their static fields filled in, split around the
+# per-call fields, keyed by the site instructions object and site. Keying on
+# id(instructions) means reloaded instructions get a fresh template.
+_TASK_TEMPLATES: Dict[Tuple[int, ResearchSite], Tuple[str, ...]] = {}
+
+# Prompt asking the LLM for the whole action sequence in one call
+PLAN_PROMPT = """
+Plan the browser actions for the task below. Reply with only a JSON array of
+steps, each an object with:
+- "action": one of goto, fill, click, press, wait_for, extract
+- "selector": a CSS selector (omit for goto)
+- "value": the URL for goto, the text for fill, the key for press
+Write the literal placeholder {query} wherever the research query is typed.
+End with a single extract step on the element holding the response.
+
+Task:
+"""
+
+# Actions a plan may contain
+PLAN_ACTIONS = frozenset({"goto", "fill", "click", "press", "wait_for", "extract"})
+
+# Timeout in milliseconds for each planned selector action
+PLAN_STEP_TIMEOUT = 15000
+
+# Last action plan that worked, keyed by (site, hash of the task template);
+# a site's page structure rarely changes between queries, so one plan serves
+# them all until it stops working
+_PLAN_CACHE: Dict[Tuple[ResearchSite, int], List[Dict[str, str]]] = {}
+
+def _parse_plan(text: str) -> List[Dict[str, str]]:
+    """Parse and validate the LLM's JSON action plan"""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.strip("`").split("\n", 1)[-1]
+    plan = json.loads(text)
+    if not isinstance(plan, list) or not plan:
+        raise ValueError("Action plan must be a non-empty JSON array")
+    for step in plan:
+        if not isinstance(step, dict) or step.get("action") not in PLAN_ACTIONS:
+            raise ValueError(f"Invalid plan step: {step}")
+    return plan
+
 class BrowserUseAuth(GeminiAuth):
     """Browser-Use specific implementation of Gemini authentication"""
     
-    def __init__(self, config: ScraperConfig, agent: Agent):
+    __slots__ = ('agent',)
+    
+    def __init__(self, config: ScraperConfig, agent: "Agent"):
         super().__init__(config)
         self.agent = agent
         
@@ -41,96 +150,237 @@ class BrowserUseAuth(GeminiAuth):
         """Verification handled by Browser-Use agent"""
         return True
 
-class BrowserUseDriver(BaseResearchScraper):
+class BrowserUseDriver(BackgroundLaunchMixin, BaseResearchScraper):
     """Browser-Use implementation of research scraper"""
     
+    __slots__ = ('browser', 'agent', '_site_instructions', '_failed', '_browser_task')
+    
     def __init__(self, config: Optional[ScraperConfig] = None):
         super().__init__(config)
         self.browser = None
         self.agent = None
-        self.llm = ChatOpenAI(model="gpt-4", temperature=0.0)
-        self._site_instructions = None
+        try:
+            self._site_instructions = _SITE_INSTRUCTIONS[self.config.site]
+        except KeyError:
+            raise ValueError(f"Browser-Use has no instructions for site {self.config.site}") from None
+        self._failed = False
+        
+    @property
+    def llm(self) -> "ChatOpenAI":
+        """Get the LLM driving the agent"""
+        return get_llm()
         
     @property
     def site_instructions(self) -> Any:
-        """Get the appropriate site instructions for the current site"""
-        if not self._site_instructions:
-            site_map = {
-                ResearchSite.PERPLEXITY: PerplexitySiteInstructions,
-                ResearchSite.GEMINI: GeminiSiteInstructions
-            }
-            self._site_instructions = site_map[self.config.site].BrowserUse
+        """Get the site instructions, resolved once when the driver is built"""
         return self._site_instructions
         
+    async def prepare_login_credentials(self) -> None:
+        """Validate credentials and warm up the LLM client while the browser starts"""
+        await super().prepare_login_credentials()
+        # Built on the loop thread, where the shared HTTP client belongs and
+        # the client singletons can't be raced
+        self.llm
+        
     async def setup(self) -> None:
-        """Initialize Browser-Use browser"""
+        """Start taking a browser from the pool; research waits for it"""
+        self._ensure_browser_task()
+        
+    @property
+    def pool_key(self) -> Tuple[bool, Tuple[str, ...]]:
+        """Key identifying pooled browsers this driver can use"""
+        return (self.config.headless, self.config.chrome_args)
+        
+    async def _launch_browser(self) -> None:
+        """Take a Browser-Use browser from the pool"""
         logger.info("Starting Browser-Use browser...")
         try:
-            context_config = BrowserContextConfig(
-                browser_window_size={'width': 1920, 'height': 1080},
-                wait_for_network_idle_page_load_time=3.0
-            )
-            
-            browser_config = BrowserConfig(
-                headless=self.config.headless,
-                disable_security=True,
-                new_context_config=context_config
-            )
-            
-            self.browser = Browser(config=browser_config)
+            self.browser = await browser_use_pool.acquire(self.pool_key)
             logger.info("Browser started successfully")
         except Exception as e:
-            logger.error(f"Browser startup error: {str(e)}")
+            logger.error("Browser startup error: %s", e)
             raise
 
     async def cleanup(self) -> None:
-        """Clean up Browser-Use resources"""
+        """Return the browser to the pool, recycling it if the request failed"""
+        await self._settle_browser_task()
         if self.browser:
             logger.info("Cleaning up resources...")
-            await self.browser.close()
+            await browser_use_pool.release(
+                self.pool_key,
+                self.browser,
+                pool_size=self.config.pool_size,
+                max_uses=self.config.max_uses_per_instance,
+                discard=self._failed
+            )
             self.browser = None
             self.agent = None
-            logger.info("Browser stopped successfully")
+            logger.info("Browser released to pool")
 
-    async def handle_site_specific_research(self, site: ResearchSite, query: str) -> str:
-        """Handle research using site-specific instructions"""
-        instructions = self.site_instructions.instructions
-        
-        try:
-            # Create task using site-specific template and instructions
-            task = self.site_instructions.TASK_TEMPLATE.format(
+    @property
+    def task_parts(self) -> Tuple[str, ...]:
+        """
+        Get the site task template with every static field filled in, split
+        into literal text alternating with the names of the per-call fields.
+        Formatted once per site per process.
+        """
+        key = (id(self.site_instructions), self.config.site)
+        parts = _TASK_TEMPLATES.get(key)
+        if parts is None:
+            instructions = self.site_instructions.instructions
+            template = self.site_instructions.TASK_TEMPLATE.format(
                 url=self.config.site_config.url,
-                query=query,
-                input_selectors=", ".join(instructions.selectors.input_field),
-                response_selectors=", ".join(instructions.selectors.response_content),
+                input_selectors=instructions.selectors.input_css,
+                response_selectors=instructions.selectors.response_css,
                 pre_wait=instructions.navigation.pre_input_wait_time,
                 post_wait=instructions.navigation.post_input_wait_time,
-                response_wait=instructions.navigation.response_wait_time
+                response_wait=instructions.navigation.response_wait_time,
+                **_TASK_FIELD_MARKERS
             )
-            
-            # Create agent with the task
+            parts = _TASK_TEMPLATES[key] = tuple(_TASK_FIELD_SPLIT.split(template))
+        return parts
+
+    def _fill_task(self, query: str) -> str:
+        """Fill the credentials and query into the cached task template"""
+        values = {
+            "email": str(self.config.google_email),
+            "password": str(self.config.google_password),
+            "query": query
+        }
+        return "".join(
+            values[part] if i % 2 else part
+            for i, part in enumerate(self.task_parts)
+        )
+
+    @property
+    def task_template(self) -> str:
+        """Get the filled-in task template with only the {query} placeholder left"""
+        return self._fill_task("{query}")
+        
+    def build_task(self, query: str) -> str:
+        """Build the agent task for a query"""
+        return self._fill_task(query)
+        
+    @property
+    def plan_key(self) -> Tuple[ResearchSite, int]:
+        """Key under which this driver's action plan is cached"""
+        return (self.config.site, hash(self.task_template))
+        
+    def site_playbook(self) -> List[Dict[str, str]]:
+        """Fixed action plan built from the site's own selectors, needing no LLM"""
+        selectors = self.site_instructions.instructions.selectors
+        return [
+            {"action": "goto", "value": self.config.site_config.url},
+            {"action": "fill", "selector": selectors.input_css, "value": "{query}"},
+            {"action": "press", "selector": selectors.input_css, "value": "Enter"},
+            {"action": "extract", "selector": selectors.response_css}
+        ]
+        
+    async def plan_actions(self) -> List[Dict[str, str]]:
+        """Ask the LLM for the whole action plan in one call"""
+        logger.info("Planning Browser-Use actions...")
+        response = await self.llm.ainvoke(PLAN_PROMPT + self.task_template)
+        return _parse_plan(response.content)
+        
+    async def _try_plan(self, plan: List[Dict[str, str]], query: str) -> str:
+        """Run a plan, remembering it if it works and forgetting it if it fails"""
+        try:
+            results = await self._run_plan(plan, query)
+        except Exception as e:
+            logger.warning("Planned actions failed: %s", e)
+            results = ""
+        if results:
+            _PLAN_CACHE[self.plan_key] = plan
+        elif _PLAN_CACHE.get(self.plan_key) is plan:
+            del _PLAN_CACHE[self.plan_key]
+        return results
+        
+    async def _run_plan(self, plan: List[Dict[str, str]], query: str) -> str:
+        """Execute a planned action sequence directly, without further LLM calls"""
+        context = await self.browser.new_context()
+        try:
+            page = await context.get_current_page()
+            results = ""
+            for step in plan:
+                action = step["action"]
+                selector = step.get("selector", "")
+                value = step.get("value", "").replace("{query}", query)
+                if action == "goto":
+                    await page.goto(value)
+                elif action == "fill":
+                    await page.fill(selector, value, timeout=PLAN_STEP_TIMEOUT)
+                elif action == "click":
+                    await page.click(selector, timeout=PLAN_STEP_TIMEOUT)
+                elif action == "press":
+                    await page.press(selector, value, timeout=PLAN_STEP_TIMEOUT)
+                elif action == "wait_for":
+                    await page.wait_for_selector(selector, timeout=PLAN_STEP_TIMEOUT)
+                else:
+                    results = await wait_for_stable_text(page, selector, timeout=PLAN_STEP_TIMEOUT / 1000)
+            return results
+        finally:
+            await context.close()
+        
+    async def _run_agent(self, query: str) -> str:
+        """Let the Browser-Use agent work through the task step by step"""
+        from browser_use import Agent
+        
+        # Create task from the precompiled site-specific template
+        task = self.build_task(query)
+        
+        # Run the agent in its own context so the pooled browser can be shared
+        # with other requests, whatever site they target
+        context = await self.browser.new_context()
+        try:
             self.agent = Agent(
                 task=task,
                 llm=self.llm,
                 browser=self.browser,
+                browser_context=context,
                 generate_gif=False,
-                max_input_tokens=32000,
+                max_input_tokens=6000,
                 max_actions_per_step=3
             )
             
             # Execute the task and get results
             logger.info("Executing Browser-Use agent task...")
             result = await self.agent.run(max_steps=5)
+            return result.final_result()
+        finally:
+            await context.close()
+        
+    async def handle_site_specific_research(self, site: ResearchSite, query: str) -> str:
+        """
+        Handle research using site-specific instructions. The last plan that
+        worked (or, the first time, the site's fixed playbook) is run without
+        any LLM call. If it fails the LLM plans the actions in one call, and
+        the agent is only used if that plan fails too.
+        """
+        await self._ensure_browser_ready()
+        try:
+            results = await self._try_plan(_PLAN_CACHE.get(self.plan_key) or self.site_playbook(), query)
+            
+            if not results:
+                try:
+                    plan = await self.plan_actions()
+                except Exception as e:
+                    logger.warning("Action planning failed: %s", e)
+                else:
+                    results = await self._try_plan(plan, query)
+            
+            if not results:
+                logger.info("Falling back to Browser-Use agent...")
+                results = await self._run_agent(query)
             
-            if result.final_result():
+            if results:
                 logger.info("Found results")
-                return result.final_result()
+                return results
             
-            logger.warning("No results found")
-            return "No results found"
+            raise RuntimeError("No results found")
             
         except Exception as e:
-            logger.error(f"Query submission error: {str(e)}")
+            logger.error("Query submission error: %s", e)
+            self._failed = True
             raise
     
     async def execute_research(self, query: str) -> str:
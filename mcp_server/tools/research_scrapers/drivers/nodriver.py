@@ -1,49 +1,327 @@
 """NoDriver-based implementation for research scraping."""
+import json
+import atexit
+import base64
 import logging
 import asyncio
-from typing import Optional, Any, Type
-import nodriver
-from nodriver import Browser, Config
-from langchain_openai import ChatOpenAI
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Dict, Mapping, Optional, Any, Set, Tuple, Type
 
-from ..core.base import BaseResearchScraper
+from ..core.base import BackgroundLaunchMixin, BaseResearchScraper
 from ..core.auth import GeminiAuth
-from ..core.config import ScraperConfig, ResearchSite
+from ..core.config import BLOCKED_URL_PATTERNS, ScraperConfig, ResearchSite
+from ..core.waits import STABLE_TEXT_CAP, STABLE_TEXT_JS, first_found
 from ....logging_config import setup_logging
 from ..sites.perplexity.scraper import PerplexitySiteInstructions
 from ..sites.gemini.scraper import GeminiSiteInstructions
 
+if TYPE_CHECKING:
+    from nodriver import Browser
+
 logger = setup_logging(__name__)
 
+# Site instructions for each research site, looked up once per driver
+_SITE_INSTRUCTIONS: Mapping[ResearchSite, Any] = MappingProxyType({
+    ResearchSite.PERPLEXITY: PerplexitySiteInstructions.NoDriver,
+    ResearchSite.GEMINI: GeminiSiteInstructions.NoDriver
+})
+
+async def _wait_for(page: Any, selector: str, timeout: float = 5.0, interval: float = 0.1) -> Any:
+    """
+    Poll the page until an element matching selector appears.
+    Returns the element, or None if it did not appear within timeout seconds.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            element = await page.query_selector(selector)
+        except Exception:
+            element = None
+        if element or loop.time() >= deadline:
+            return element
+        await asyncio.sleep(interval)
+
+async def _wait_for_stable_text(
+    page: Any,
+    selector: str,
+    timeout: float,
+    quiet: float = 0.75,
+    cap: float = STABLE_TEXT_CAP
+) -> str:
+    """
+    Wait in the page for the element's text to stop changing and return it.
+    The wait is driven by DOM mutations, so it returns as soon as the response
+    settles instead of after a fixed delay.
+    """
+    script = (
+        f"({STABLE_TEXT_JS})({json.dumps(selector)}, "
+        f"{int(quiet * 1000)}, {int(timeout * 1000)}, {int(cap * 1000)})"
+    )
+    return await page.evaluate(script, await_promise=True, return_by_value=True)
+
+# Name of the CDP binding the page calls to push streamed response text
+_STREAM_BINDING = "__researchStream"
+
+# Pushes text appended to the first element matching the selector through the
+# binding as it arrives, then a final message once it has been quiet for
+# quiet_ms, or if nothing appeared within timeout_ms, or cap_ms after the first
+# text. Rewrites of already-sent text are not resent.
+_STREAM_TEXT_JS = """
+(() => {
+    const selector = %(selector)s;
+    const send = (text, done) => window[%(binding)s](JSON.stringify({text, done}));
+    const read = () => {
+        const el = document.querySelector(selector);
+        return el ? el.innerText : '';
+    };
+    let sent = '';
+    let quiet = null;
+    let deadline = null;
+    const push = (done) => {
+        const text = read();
+        const appended = text.startsWith(sent) ? text.slice(sent.length) : '';
+        if (appended || done) send(appended, done);
+        sent += appended;
+    };
+    const finish = () => {
+        observer.disconnect();
+        clearTimeout(quiet);
+        clearTimeout(deadline);
+        push(true);
+    };
+    const check = () => {
+        const text = read();
+        if (!text || text === sent) return;
+        if (!sent) {
+            clearTimeout(deadline);
+            deadline = setTimeout(finish, %(cap_ms)d);
+        }
+        push(false);
+        clearTimeout(quiet);
+        quiet = setTimeout(finish, %(quiet_ms)d);
+    };
+    const observer = new MutationObserver(check);
+    deadline = setTimeout(finish, %(timeout_ms)d);
+    observer.observe(document.body, {subtree: true, childList: true, characterData: true});
+    check();
+})()
+"""
+
+async def _stream_text(
+    page: Any,
+    selector: str,
+    timeout: float,
+    quiet: float = 0.75,
+    cap: float = STABLE_TEXT_CAP
+) -> AsyncIterator[str]:
+    """
+    Yield the element's text in chunks as the page appends to it.
+    The page pushes each chunk over a CDP binding from a MutationObserver,
+    so chunks arrive as they render instead of in one read at the end.
+    """
+    from nodriver import cdp
+    
+    chunks: asyncio.Queue = asyncio.Queue()
+    
+    def on_binding(event: "cdp.runtime.BindingCalled") -> None:
+        if event.name == _STREAM_BINDING:
+            chunks.put_nowait(json.loads(event.payload))
+    
+    script = _STREAM_TEXT_JS % {
+        'selector': json.dumps(selector),
+        'binding': json.dumps(_STREAM_BINDING),
+        'quiet_ms': int(quiet * 1000),
+        'timeout_ms': int(timeout * 1000),
+        'cap_ms': int(cap * 1000),
+    }
+    page.add_handler(cdp.runtime.BindingCalled, on_binding)
+    try:
+        await page.send(cdp.runtime.add_binding(name=_STREAM_BINDING))
+        await page.evaluate(script)
+        while True:
+            # The page's own deadline ends the stream; this only guards against
+            # the page going away before it could send the final message
+            message = await asyncio.wait_for(chunks.get(), timeout=max(timeout, cap) + quiet + 5.0)
+            if message['text']:
+                yield message['text']
+            if message['done']:
+                return
+    finally:
+        page.remove_handler(cdp.runtime.BindingCalled, on_binding)
+
+class _ResponseCapture:
+    """
+    Reads the site's streamed answer straight off the network. Responses from
+    URLs containing url_part are tracked, and once one finishes loading its
+    body is fetched over CDP and handed to the site's parser.
+    """
+    
+    def __init__(self, page: Any, url_part: str, parse: Callable[[str], str]):
+        self.page = page
+        self.url_part = url_part
+        self.parse = parse
+        self._request_ids: set = set()
+        self._finished: Optional[asyncio.Future] = None
+    
+    def _on_response(self, event: "cdp.network.ResponseReceived") -> None:
+        if self.url_part in event.response.url:
+            self._request_ids.add(event.request_id)
+    
+    def _on_finished(self, event: "cdp.network.LoadingFinished") -> None:
+        if event.request_id in self._request_ids and not self._finished.done():
+            self._finished.set_result(event.request_id)
+    
+    async def start(self) -> None:
+        """Start watching responses; call before the request is sent"""
+        from nodriver import cdp
+        self._finished = asyncio.get_running_loop().create_future()
+        self.page.add_handler(cdp.network.ResponseReceived, self._on_response)
+        self.page.add_handler(cdp.network.LoadingFinished, self._on_finished)
+        await self.page.send(cdp.network.enable())
+    
+    def stop(self) -> None:
+        """Stop watching responses"""
+        from nodriver import cdp
+        self.page.remove_handler(cdp.network.ResponseReceived, self._on_response)
+        self.page.remove_handler(cdp.network.LoadingFinished, self._on_finished)
+    
+    async def result(self, timeout: float) -> str:
+        """
+        Wait for the response to finish and return the parsed answer, or ''
+        if it did not arrive in time or could not be read.
+        """
+        from nodriver import cdp
+        try:
+            request_id = await asyncio.wait_for(asyncio.shield(self._finished), timeout=timeout)
+            body, is_base64 = await self.page.send(cdp.network.get_response_body(request_id))
+            if is_base64:
+                body = base64.b64decode(body).decode('utf-8', errors='replace')
+            return self.parse(body).strip()
+        except Exception as e:
+            logger.warning("Could not read response from network: %s", e)
+            return ''
+
+class _SelectorCache:
+    """
+    Elements already looked up on a page, so repeated lookups skip the CDP
+    round trip. Entries belong to a page-state generation, which is bumped
+    whenever the main frame navigates or the caller invalidates after an
+    action that rewrites the DOM; only current-generation entries are reused.
+    """
+    
+    def __init__(self, page: Any):
+        from nodriver import cdp
+        self.generation = 0
+        self._entries: Dict[Tuple[str, str], Tuple[int, Any]] = {}
+        page.add_handler(cdp.page.FrameNavigated, self._on_frame_navigated)
+    
+    def _on_frame_navigated(self, event: "cdp.page.FrameNavigated") -> None:
+        if event.frame.parent_id is None:
+            self.invalidate()
+    
+    def invalidate(self) -> None:
+        """Forget every element from the current page state"""
+        self.generation += 1
+        self._entries.clear()
+    
+    def put(self, kind: str, selector: str, element: Any) -> None:
+        """Remember an element found by some other lookup, e.g. a wait"""
+        if element:
+            self._entries[(kind, selector)] = (self.generation, element)
+    
+    async def get_or_fetch(self, kind: str, selector: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached element for (kind, selector), fetching it on a miss"""
+        entry = self._entries.get((kind, selector))
+        if entry and entry[0] == self.generation:
+            return entry[1]
+        generation = self.generation
+        element = await fetch()
+        # Don't store an element if the page moved on while it was fetched
+        if element and generation == self.generation:
+            self._entries[(kind, selector)] = (generation, element)
+        return element
+
 class NoDriverAuth(GeminiAuth):
     """NoDriver-specific implementation of Gemini authentication"""
     
-    def __init__(self, config: ScraperConfig, page: Any):
+    __slots__ = ('page', '_cache')
+    
+    # Selectors used during the Google login flow. Exact CSS lookups are tried
+    # first; the fuzzy-match texts are only a fallback when the markup changes.
+    SEL_SIGN_IN = 'a[href*="ServiceLogin"], [data-test-id="action-button"], button[aria-label*="Sign in"]'
+    SEL_EMAIL = 'input[type="email"]'
+    SEL_EMAIL_NEXT = '#identifierNext button'
+    SEL_PASSWORD_NEXT = '#passwordNext button'
+    SEL_2FA_NEXT = '#totpNext button'
+    SEL_PASSWORD = 'input[type="password"]'
+    SEL_2FA = 'input[type="tel"]'
+    SEL_CHAT_INPUT = 'textarea'
+    SEL_2FA_OR_CHAT = f'{SEL_2FA}, {SEL_CHAT_INPUT}'
+    TEXT_SIGN_IN = "Sign in"
+    TEXT_EMAIL = "email"
+    TEXT_NEXT = "Next"
+    
+    def __init__(self, config: ScraperConfig, page: Any, cache: Optional[_SelectorCache] = None):
         super().__init__(config)
         self.page = page
+        self._cache = cache or _SelectorCache(page)
+        
+    async def _wait_for(self, selector: str, timeout: float) -> Any:
+        """Wait for an element and remember it for the next lookup"""
+        element = await _wait_for(self.page, selector, timeout=timeout)
+        self._cache.put('select', selector, element)
+        return element
+        
+    async def _select(self, selector: str) -> Any:
+        """Select an element, reusing one already found on this page state"""
+        async def fetch() -> Any:
+            try:
+                return await self.page.query_selector(selector)
+            except Exception:
+                return None
+        return await self._cache.get_or_fetch('select', selector, fetch)
+        
+    async def _locate(self, selector: str, text: str) -> Any:
+        """Find an element by exact selector, falling back to fuzzy text matching"""
+        element = await self._select(selector)
+        if element is None:
+            element = await self._cache.get_or_fetch(
+                'find', text, lambda: self.page.find(text, best_match=True)
+            )
+        return element
+        
+    async def _click(self, element: Any) -> None:
+        """Click an element; the login flow swaps views, so forget resolved elements"""
+        self._cache.invalidate()
+        await element.click()
+        
+    async def is_logged_in(self) -> bool:
+        """Signed in if the chat input loads without a sign-in link on the page"""
+        if not await self._wait_for(f'{self.SEL_SIGN_IN}, {self.SEL_CHAT_INPUT}', timeout=10.0):
+            return False
+        return await self._select(self.SEL_SIGN_IN) is None
         
     async def navigate_to_login(self) -> None:
         """Navigate to Google login page"""
-        await self.page.sleep(2)
-        sign_in_button = await self.page.find("Sign in", best_match=True)
+        sign_in_button = await self._locate(self.SEL_SIGN_IN, self.TEXT_SIGN_IN)
         if sign_in_button:
-            await sign_in_button.click()
-            await self.page.sleep(2)
+            await self._click(sign_in_button)
+            await self._wait_for(self.SEL_EMAIL, timeout=10.0)
         else:
             raise RuntimeError("Sign in button not found")
 
     async def enter_email(self) -> None:
         """Enter email and proceed"""
-        email_elem = await self.page.select('input[type="email"]')
-        if not email_elem:
-            email_elem = await self.page.find("email", best_match=True)
+        email_elem = await self._locate(self.SEL_EMAIL, self.TEXT_EMAIL)
         
         if email_elem:
             await email_elem.send_keys(self.config.google_email)
-            next_button = await self.page.find("Next", best_match=True)
+            next_button = await self._locate(self.SEL_EMAIL_NEXT, self.TEXT_NEXT)
             if next_button:
-                await next_button.click()
-                await self.page.sleep(2)
+                await self._click(next_button)
+                await self._wait_for(self.SEL_PASSWORD, timeout=10.0)
             else:
                 raise RuntimeError("Next button not found after email")
         else:
@@ -51,13 +329,14 @@ class NoDriverAuth(GeminiAuth):
 
     async def enter_password(self) -> None:
         """Enter password and submit"""
-        pwd_elem = await self.page.select('input[type="password"]')
+        pwd_elem = await self._select(self.SEL_PASSWORD)
         if pwd_elem:
             await pwd_elem.send_keys(self.config.google_password)
-            next_button = await self.page.find("Next", best_match=True)
+            next_button = await self._locate(self.SEL_PASSWORD_NEXT, self.TEXT_NEXT)
             if next_button:
-                await next_button.click()
-                await self.page.sleep(5)
+                await self._click(next_button)
+                # Either the 2FA prompt or the chat input shows up next
+                await self._wait_for(self.SEL_2FA_OR_CHAT, timeout=15.0)
             else:
                 raise RuntimeError("Next button not found after password")
         else:
@@ -67,127 +346,306 @@ class NoDriverAuth(GeminiAuth):
         """Handle 2FA if required"""
         if self._2fa_code:
             # Look for 2FA input
-            code_input = await self.page.select('input[type="tel"]')
+            code_input = await self._select(self.SEL_2FA)
             if code_input:
                 await code_input.send_keys(self._2fa_code)
-                next_button = await self.page.find("Next", best_match=True)
+                next_button = await self._locate(self.SEL_2FA_NEXT, self.TEXT_NEXT)
                 if next_button:
-                    await next_button.click()
-                    await self.page.sleep(5)
+                    await self._click(next_button)
+                    await self._wait_for(self.SEL_CHAT_INPUT, timeout=15.0)
 
     async def verify_login_success(self) -> bool:
         """Verify successful login"""
         try:
-            # Wait for Gemini interface to load
-            await self.page.sleep(2)
-            return True
+            # Wait for Gemini chat input to load
+            return await self._wait_for(self.SEL_CHAT_INPUT, timeout=10.0) is not None
         except Exception:
             return False
 
-class NoDriverDriver(BaseResearchScraper):
+@dataclass
+class NoDriverSession:
+    """
+    A browser shared by every research request with the same session key.
+    Requests for different sites share it too, each in its own tab.
+    """
+    driver: "Browser"
+    refcount: int = 0
+    uses: int = 0
+    logged_in: Set[ResearchSite] = field(default_factory=set)
+    login_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+# Identifies browsers that can be shared: (email, headless, chrome_args)
+SessionKey = Tuple[Optional[str], bool, Tuple[str, ...]]
+
+# Shared browsers kept alive across requests
+_SESSION_CACHE: Dict[SessionKey, NoDriverSession] = {}
+_SESSION_LOCK = asyncio.Lock()
+
+async def _get_shared_browser(key: SessionKey, config: ScraperConfig) -> NoDriverSession:
+    """
+    Check out the shared browser for key, launching it on first use.
+    A browser that has served config.max_uses_per_instance requests is retired and replaced;
+    it is stopped once its remaining tabs are released.
+    """
+    async with _SESSION_LOCK:
+        session = _SESSION_CACHE.get(key)
+        # A persistent profile can only be open in one browser at a time, so
+        # such a browser is only recycled once it has no tabs left
+        if (
+            session
+            and session.uses >= config.max_uses_per_instance
+            and not (config.user_data_dir and session.refcount)
+        ):
+            logger.info("Recycling NoDriver browser after %d uses", session.uses)
+            del _SESSION_CACHE[key]
+            if session.refcount == 0:
+                session.driver.stop()
+            session = None
+        if session is None:
+            # Imported here so the module loads without paying for nodriver
+            import nodriver
+            
+            logger.info("Starting NoDriver browser...")
+            driver = await nodriver.start(
+                headless=config.headless,
+                browser_args=list(config.chrome_args),
+                user_data_dir=config.user_data_dir or None,
+                no_sandbox=True
+            )
+            session = NoDriverSession(driver)
+            _SESSION_CACHE[key] = session
+            logger.info("Browser started successfully")
+        session.refcount += 1
+        session.uses += 1
+        return session
+
+async def _release_shared_browser(key: SessionKey, session: NoDriverSession, discard: bool = False) -> None:
+    """
+    Return a checked-out browser. Idle browsers stay cached for the next
+    request; a discarded one is stopped once its last tab is released.
+    """
+    async with _SESSION_LOCK:
+        session.refcount -= 1
+        if discard and _SESSION_CACHE.get(key) is session:
+            del _SESSION_CACHE[key]
+        if session.refcount == 0 and _SESSION_CACHE.get(key) is not session:
+            session.driver.stop()
+
+def _stop_cached_sessions() -> None:
+    """Stop every cached browser on interpreter shutdown"""
+    for session in _SESSION_CACHE.values():
+        session.driver.stop()
+    _SESSION_CACHE.clear()
+
+atexit.register(_stop_cached_sessions)
+
+class NoDriverDriver(BackgroundLaunchMixin, BaseResearchScraper):
     """NoDriver implementation of research scraper"""
     
+    __slots__ = ('driver', 'page', '_site_instructions', '_session', '_selector_cache', '_opened_logged_in', '_browser_task')
+    
     def __init__(self, config: Optional[ScraperConfig] = None):
         super().__init__(config)
         self.driver = None
         self.page = None
-        self._site_instructions = None
+        try:
+            self._site_instructions = _SITE_INSTRUCTIONS[self.config.site]
+        except KeyError:
+            raise ValueError(f"NoDriver has no instructions for site {self.config.site}") from None
+        self._session: Optional[NoDriverSession] = None
+        self._selector_cache: Optional[_SelectorCache] = None
+        self._opened_logged_in = False
+        
+    @property
+    def session_key(self) -> SessionKey:
+        """Key identifying the shared browser this driver opens its tab in"""
+        return (self.config.google_email, self.config.headless, self.config.chrome_args)
+        
+    @property
+    def auth(self) -> Optional[GeminiAuth]:
+        """Get NoDriver auth handler"""
+        if not self.config.site_config.requires_auth:
+            return None
+        if not self._auth:
+            if not self.page:
+                raise RuntimeError("Browser page not initialized")
+            self._auth = NoDriverAuth(self.config, self.page, self.selector_cache)
+        return self._auth
         
     @property
     def site_instructions(self) -> Any:
-        """Get the appropriate site instructions for the current site"""
-        if not self._site_instructions:
-            site_map = {
-                ResearchSite.PERPLEXITY: PerplexitySiteInstructions,
-                ResearchSite.GEMINI: GeminiSiteInstructions
-            }
-            self._site_instructions = site_map[self.config.site].NoDriver
+        """Get the site instructions, resolved once when the driver is built"""
         return self._site_instructions
         
+    @property
+    def selector_cache(self) -> _SelectorCache:
+        """Get the element cache for this request's tab"""
+        if not self._selector_cache:
+            if not self.page:
+                raise RuntimeError("Browser page not initialized")
+            self._selector_cache = _SelectorCache(self.page)
+        return self._selector_cache
+        
     async def setup(self) -> None:
-        """Initialize NoDriver browser"""
-        logger.info("Starting NoDriver browser...")
+        """Start opening this request's tab; login and research wait for it"""
+        self._ensure_browser_task()
+        
+    async def _launch_browser(self) -> None:
+        """Open a tab for this request in the shared NoDriver browser"""
         try:
-            self.driver = await nodriver.start(
-                headless=self.config.headless,
-                browser_args=['--no-sandbox', '--disable-dev-shm-usage'],
-                no_sandbox=True
-            )
-            self.page = await self.driver.get(self.config.site_config.url)
-            logger.info("Browser started successfully")
+            self._session = await _get_shared_browser(self.session_key, self.config)
+            self.driver = self._session.driver
+            self._opened_logged_in = self.config.site in self._session.logged_in
+            if self.config.block_resources:
+                # Install the block list on a blank tab before the site starts loading
+                from nodriver import cdp
+                self.page = await self.driver.get("about:blank", new_tab=True)
+                await self.page.send(cdp.network.enable())
+                # set_blocked_ur_ls is nodriver's generated name for Network.setBlockedURLs
+                await self.page.send(cdp.network.set_blocked_ur_ls(urls=list(BLOCKED_URL_PATTERNS)))
+                await self.page.get(self.config.site_config.url)
+            else:
+                self.page = await self.driver.get(self.config.site_config.url, new_tab=True)
         except Exception as e:
-            logger.error(f"Browser startup error: {str(e)}")
+            logger.error("Browser startup error: %s", e)
+            await self._release(discard=True)
             raise
 
+    async def _release(self, discard: bool = False) -> None:
+        """Close this request's tab and give the shared browser back"""
+        if self.page:
+            try:
+                await self.page.close()
+            except Exception as e:
+                logger.warning("Failed to close tab: %s", e)
+        if self._session:
+            await _release_shared_browser(self.session_key, self._session, discard=discard)
+            self._session = None
+        self.driver = None
+        self.page = None
+        self._selector_cache = None
+
+    async def login(self) -> bool:
+        """Log in once per site in the shared browser; concurrent requests wait for the first"""
+        await self._ensure_browser_ready()
+        async with self._session.login_lock:
+            if self.config.site in self._session.logged_in:
+                if not self._opened_logged_in:
+                    # Another tab logged in after this one opened; reload with its cookies
+                    await self.page.get(self.config.site_config.url)
+                logger.debug("Reusing authenticated browser, skipping login")
+                return True
+            success = await super().login()
+            if success:
+                self._session.logged_in.add(self.config.site)
+            return success
+
     async def cleanup(self) -> None:
-        """Clean up NoDriver resources"""
-        if self.driver:
-            logger.info("Cleaning up resources...")
-            self.driver.stop()
-            self.driver = None
-            self.page = None
-            logger.info("Browser stopped successfully")
+        """Close this request's tab; the browser stays up for other requests"""
+        logger.debug("Releasing shared browser tab...")
+        await self._settle_browser_task()
+        await self._release()
 
-    async def handle_site_specific_research(self, site: ResearchSite, query: str) -> str:
-        """Handle research using site-specific instructions"""
-        instructions = self.site_instructions.instructions
+    async def _find_input(self, selector: str) -> Any:
+        """Look up an input by CSS selector, reusing one already found on this page"""
+        return await self.selector_cache.get_or_fetch('select', selector, lambda: self.page.select(selector))
+
+    async def _submit_query(self, query: str) -> Tuple[str, float]:
+        """
+        Submit the query using site-specific instructions.
+        Returns the response selector and how long to wait for the response.
+        """
+        await self._ensure_browser_ready()
+        site_instructions = self.site_instructions
+        selectors = site_instructions.instructions.selectors
+        navigation = site_instructions.instructions.navigation
+        find_input = self._find_input
+        
+        # Look for input field using site-specific selectors. The selectors are
+        # tried concurrently rather than one after another, so a selector that
+        # doesn't match no longer holds up the others for its whole timeout.
+        logger.debug("Looking for query input field...")
+        input_elem = await first_found(*(find_input(selector) for selector in selectors.input_field))
+        
+        if not input_elem:
+            raise RuntimeError("Query input not found")
+        
+        logger.debug("Found input field, entering query...")
         
+        # Use site-specific submit method
+        await site_instructions.submit_query(self.page, query)
+        
+        return (
+            selectors.response_css,
+            navigation.post_input_wait_time + navigation.response_wait_time
+        )
+
+    async def _response_capture(self) -> Optional[_ResponseCapture]:
+        """Start capturing the site's streamed answer, if it has a known endpoint"""
+        url_part = getattr(self.site_instructions, 'RESPONSE_URL', None)
+        if not url_part:
+            return None
+        await self._ensure_browser_ready()
+        capture = _ResponseCapture(self.page, url_part, self.site_instructions.parse_response)
         try:
-            # Look for input field using site-specific selectors
-            logger.info("Looking for query input field...")
-            input_elem = None
+            await capture.start()
+        except Exception as e:
+            capture.stop()
+            logger.warning("Could not watch network responses: %s", e)
+            return None
+        return capture
+
+    async def handle_site_specific_research(self, site: ResearchSite, query: str) -> str:
+        """
+        Handle research using site-specific instructions. The answer is read
+        from the site's streaming response where possible, falling back to
+        the rendered page.
+        """
+        capture = None
+        try:
+            capture = await self._response_capture()
+            selector, timeout = await self._submit_query(query)
             
-            # Try each input selector
-            for selector in instructions.selectors.input_field:
-                try:
-                    input_elem = await self.page.select(selector)
-                    if input_elem:
-                        break
-                except Exception:
-                    try:
-                        # NoDriver's fallback to fuzzy text matching
-                        input_elem = await self.page.find(selector, best_match=True)
-                        if input_elem:
-                            break
-                    except Exception:
-                        continue
+            results = ''
+            if capture:
+                logger.debug("Waiting for streamed response...")
+                results = await capture.result(timeout)
             
-            if input_elem:
-                logger.info("Found input field, entering query...")
-                await self.page.sleep(instructions.navigation.pre_input_wait_time)
-                
-                # Use site-specific submit method
-                await self.site_instructions.submit_query(self.page, query)
-                
-                await self.page.sleep(instructions.navigation.post_input_wait_time)
-                
-                # Look for results using site-specific selectors
-                logger.info("Looking for response content...")
-                await self.page.sleep(instructions.navigation.response_wait_time)
-                
-                for selector in instructions.selectors.response_content:
-                    try:
-                        results_elem = await self.page.select(selector)
-                        if not results_elem:
-                            results_elem = await self.page.find(selector, best_match=True)
-                        
-                        if results_elem:
-                            results = await results_elem.text()
-                            if results:
-                                logger.info(f"Found results using selector: {selector}")
-                                return results
-                    except Exception:
-                        continue
-                
-                logger.warning("No results found with any selector")
-                return "No results found"
-            else:
-                raise RuntimeError("Query input not found")
+            if not results:
+                # Wait for the response text to settle and read it in one call
+                logger.debug("Waiting for response content...")
+                results = await _wait_for_stable_text(self.page, selector, timeout=timeout)
+            if results:
+                logger.info("Found results")
+                return results
+            
+            raise RuntimeError("No results found with any selector")
             
         except Exception as e:
-            logger.error(f"Query submission error: {str(e)}")
+            logger.error("Query submission error: %s", e)
             raise
+        finally:
+            if capture:
+                capture.stop()
     
     async def execute_research(self, query: str) -> str:
         """Execute research using NoDriver"""
-        return await self.handle_site_specific_research(self.config.site, query) 
\ No newline at end of file
+        return await self.handle_site_specific_research(self.config.site, query)
+    
+    async def stream_research(self, query: str) -> AsyncIterator[str]:
+        """Execute research, yielding response text as the site renders it"""
+        try:
+            selector, timeout = await self._submit_query(query)
+            
+            logger.debug("Streaming response content...")
+            received = False
+            async for chunk in _stream_text(self.page, selector, timeout=timeout):
+                received = True
+                yield chunk
+            
+            if not received:
+                raise RuntimeError("No results found with any selector")
+            
+        except Exception as e:
+            logger.error("Query submission error: %s", e)
+            raise
@@ -1,431 +1,385 @@
 """Patchright-based implementation for research scraping."""
 import logging
 import asyncio
-from typing import Optional, Any, Type
-from patchright.async_api import async_playwright, Browser, Page, BrowserContext
+import functools
+import os
+from typing import Dict, Mapping, List, Optional, Any, Tuple, Type
+from patchright.async_api import Page, BrowserContext, Locator
 import random
-import time
+from types import MappingProxyType
+from collections import OrderedDict
 
-from ..core.base import BaseResearchScraper
 from ..core.auth import GeminiAuth
 from ..core.config import ScraperConfig, ResearchSite
+from ..core.waits import first_found, wait_for_stable_text
 from ....logging_config import setup_logging
 from ..sites.perplexity.scraper import PerplexitySiteInstructions
 from ..sites.gemini.scraper import GeminiSiteInstructions
+from ..sites.base import _PatchrightBase
 
 logger = setup_logging(__name__)
 
+# Site instructions for each research site
+_SITE_INSTRUCTIONS: Mapping[ResearchSite, Any] = MappingProxyType({
+    ResearchSite.PERPLEXITY: PerplexitySiteInstructions.Patchright,
+    ResearchSite.GEMINI: GeminiSiteInstructions.Patchright
+})
+
+# Options for every Patchright context, pooled or persistent
+_CONTEXT_OPTIONS: Dict[str, Any] = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'java_script_enabled': True,
+    'bypass_csp': True,
+    'ignore_https_errors': True,
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+    'extra_http_headers': {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+        'Cache-Control': 'no-cache',
+        'Pragma': 'no-cache'
+    }
+}
+
+# Most locators kept per driver before the least recently used is dropped
+LOCATOR_CACHE_SIZE = 128
+
+# Elements shown on a Cloudflare challenge page
+CLOUDFLARE_INDICATORS = (
+    "//h1[contains(text(), 'Checking your browser')]",
+    "//h1[contains(text(), 'Just a moment')]",
+    "//div[contains(text(), 'DDoS protection by Cloudflare')]",
+    "#challenge-running",
+    "#challenge-form",
+    "#challenge-stage"
+)
+
+# Elements that stay up while a Cloudflare challenge is being solved
+CLOUDFLARE_PENDING_INDICATORS = (
+    "//h1[contains(text(), 'Please verify you are a human')]",
+    "#success-text",
+    "#challenge-success"
+)
+
+# Google's login pages all live under this origin
+GOOGLE_ACCOUNTS_URL = "https://accounts.google.com"
+
+def _off_google_accounts(url: str) -> bool:
+    """Whether a URL has left the Google login pages"""
+    return not url.startswith(GOOGLE_ACCOUNTS_URL)
+
+# Fills a login field and clicks its Next button in one round trip. Returns
+# false if either element is missing, so the caller can fall back to fill/click.
+_FILL_AND_NEXT_JS = """
+([field, next, value]) => {
+    const input = document.querySelector(field);
+    const button = document.querySelector(next);
+    if (!input || !button) return false;
+    input.focus();
+    input.value = value;
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+    button.click();
+    return true;
+}
+"""
+
 class PatchrightAuth(GeminiAuth):
     """Patchright-specific implementation of Google authentication"""
     
+    __slots__ = ('page',)
+    
     def __init__(self, config: ScraperConfig, page: Page):
         super().__init__(config)
         self.page = page
         
     async def navigate_to_login(self) -> None:
         """Navigate to Google login page"""
-        await asyncio.sleep(2)
-        try:
-            # Try the action button first
-            sign_in_button = await self.page.locator('[data-test-id="action-button"]').click()
-        except Exception:
+        if _off_google_accounts(self.page.url):
+            # Either the action button or the link version, whichever shows up
+            sign_in = self.page.locator('[data-test-id="action-button"]').or_(
+                self.page.get_by_role("link", name="Sign in")
+            )
             try:
-                # Try the link version
-                sign_in_button = await self.page.get_by_role("link", name="Sign in").click()
+                await sign_in.first.click(timeout=10000)
             except Exception:
-                # We might already be on the login page
+                # We might already be on the way to the login page
                 pass
         
-        # Wait for the login page to load
-        await asyncio.sleep(5)
-        
-        # Check if we're already on the login page
-        current_url = self.page.url
-        if not current_url.startswith("https://accounts.google.com"):
+        # Wait for the login page itself rather than a fixed delay
+        try:
+            await self.page.wait_for_url(f"{GOOGLE_ACCOUNTS_URL}/**", timeout=15000)
+        except Exception:
             raise RuntimeError("Failed to reach Google login page")
 
+    async def _fill_and_next(self, field: str, next_button: str, value: str) -> None:
+        """Fill a login field and click Next, in-page when the elements are there"""
+        try:
+            done = await self.page.evaluate(_FILL_AND_NEXT_JS, [field, next_button, value])
+        except Exception as e:
+            logger.debug("In-page fill failed, falling back: %s", e)
+            done = False
+        if not done:
+            await self.page.fill(field, value)
+            await self.page.click('button:has-text("Next")')
+
     async def enter_email(self) -> None:
         """Enter email and proceed"""
-        await self.page.fill('input[type="email"]', self.config.google_email)
-        await self.page.click('button:has-text("Next")')
-        await asyncio.sleep(2)
+        await self._fill_and_next('input[type="email"]', '#identifierNext button', self.config.google_email)
+        await self.page.wait_for_selector('input[type="password"]', state='visible', timeout=15000)
+
+    async def _wait_for_url_off_accounts(self) -> bool:
+        """Wait until the page leaves the Google login pages"""
+        await self.page.wait_for_url(_off_google_accounts, timeout=15000)
+        return True
 
     async def enter_password(self) -> None:
         """Enter password and submit"""
-        await self.page.fill('input[type="password"]', self.config.google_password)
-        await self.page.click('button:has-text("Next")')
-        await asyncio.sleep(5)
+        await self._fill_and_next('input[type="password"]', '#passwordNext button', self.config.google_password)
+        # Next comes either a 2FA prompt or the redirect back to the site
+        await first_found(
+            self.page.wait_for_selector('input[type="tel"], [data-challenge-type]', timeout=15000),
+            self._wait_for_url_off_accounts()
+        )
 
     async def handle_2fa(self) -> None:
         """Handle 2FA if required"""
-        if self._2fa_code:
-            try:
-                await self.page.fill('input[type="tel"]', self._2fa_code)
-                await self.page.click('button:has-text("Next")')
-                await asyncio.sleep(5)
-            except Exception:
-                # No 2FA prompt found
-                pass
+        if self._2fa_code and await self.page.query_selector('input[type="tel"]'):
+            await self._fill_and_next('input[type="tel"]', '#totpNext button', self._2fa_code)
+            await self._wait_for_url_off_accounts()
 
     async def verify_login_success(self) -> bool:
         """Verify successful login"""
         try:
-            # Wait for Gemini interface to load
-            await asyncio.sleep(2)
-            return True
+            # Logged in once Google hands the page back to the site
+            return await self._wait_for_url_off_accounts()
         except Exception:
             return False
 
-class PatchrightDriver(BaseResearchScraper):
+class PatchrightDriver(_PatchrightBase):
     """Patchright implementation of research scraper"""
     
+    __slots__ = ('_site_instructions', '_locator_cache')
+    
+    AUTH_CLASS = PatchrightAuth
+    
     def __init__(self, config: Optional[ScraperConfig] = None):
         super().__init__(config)
-        self.patchright = None
-        self.browser = None
-        self.page = None
-        self._auth = None
-        self._site_instructions = None
-        self.playwright = None  # Initialize playwright attribute
+        try:
+            self._site_instructions = _SITE_INSTRUCTIONS[self.config.site]
+        except KeyError:
+            raise ValueError(f"Patchright has no instructions for site {self.config.site}") from None
+        self._locator_cache: "OrderedDict[str, Locator]" = OrderedDict()
+        
+    def locator(self, selector: str) -> Locator:
+        """Get the page's locator for selector, reusing one built earlier"""
+        locator = self._locator_cache.get(selector)
+        if locator is None:
+            locator = self._locator_cache[selector] = self.page.locator(selector)
+            if len(self._locator_cache) > LOCATOR_CACHE_SIZE:
+                self._locator_cache.popitem(last=False)
+        else:
+            self._locator_cache.move_to_end(selector)
+        return locator
         
-    @property
-    def auth(self) -> Optional[GeminiAuth]:
-        """Get Patchright auth handler"""
-        if not self.config or not self.config.site_config.requires_auth:
-            return None
-        if not self._auth:
-            if not self.page:
-                raise RuntimeError("Browser page not initialized")
-            self._auth = PatchrightAuth(self.config, self.page)
-        return self._auth
-
     @property
     def site_instructions(self) -> Any:
-        """Get the appropriate site instructions for the current site"""
-        if not self._site_instructions:
-            site_map = {
-                ResearchSite.PERPLEXITY: PerplexitySiteInstructions,
-                ResearchSite.GEMINI: GeminiSiteInstructions
-            }
-            # Create an instance of the instructions class
-            self._site_instructions = site_map[self.config.site].Patchright()
+        """Get the site instructions, resolved once when the driver is built"""
         return self._site_instructions
         
-    async def setup(self) -> None:
-        """Initialize browser and page with evasion techniques"""
-        if not self.page:
-            logger.info("Setting up browser...")
-            
-            # Initialize playwright
-            self.playwright = await async_playwright().start()
-            
-            # Configure browser launch options
-            browser_args = [
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--disable-software-rasterizer',
-                '--disable-extensions',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-automation',
-                '--disable-web-security',
-                '--disable-features=IsolateOrigins,site-per-process',
-                '--enable-javascript',
-                '--window-size=1920,1080'
-            ]
-            
-            # Launch browser with configured options
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.config.headless,
-                args=browser_args
-            )
-            
-            # Configure context with advanced evasion
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                java_script_enabled=True,
-                bypass_csp=True,
-                ignore_https_errors=True,
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1'
-                }
-            )
-            
-            # Add advanced evasion scripts
-            await context.add_init_script("""
-                // Mask automation indicators
-                Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-                Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-                Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-                
-                // Mock Chrome runtime
-                window.chrome = {
-                    runtime: {},
-                    app: {},
-                    csi: function(){},
-                    loadTimes: function(){}
-                };
-                
-                // Override permissions query
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                    Promise.resolve({state: Notification.permission}) :
-                    originalQuery(parameters)
-                );
-                
-                // Add WebGL support
-                const getParameter = WebGLRenderingContext.getParameter;
-                WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                    if (parameter === 37445) {
-                        return 'Intel Inc.';
-                    }
-                    if (parameter === 37446) {
-                        return 'Intel Iris OpenGL Engine';
-                    }
-                    return getParameter(parameter);
-                };
-                
-                // Add touch support
-                const touchEvent = new TouchEvent("touchstart", {
-                    touches: [{
-                        identifier: 1,
-                        pageX: 150,
-                        pageY: 150,
-                        screenX: 150,
-                        screenY: 150,
-                        clientX: 150,
-                        clientY: 150,
-                        target: document.body
-                    }],
-                    targetTouches: [],
-                    changedTouches: [],
-                    view: window,
-                    bubbles: true,
-                    cancelable: true
-                });
-                
-                // Randomize canvas fingerprint
-                const originalGetContext = HTMLCanvasElement.prototype.getContext;
-                HTMLCanvasElement.prototype.getContext = function(type) {
-                    const context = originalGetContext.apply(this, arguments);
-                    if (type === '2d') {
-                        const originalFillText = context.fillText;
-                        context.fillText = function() {
-                            arguments[0] = arguments[0] + ' ';
-                            return originalFillText.apply(this, arguments);
-                        }
-                    }
-                    return context;
-                };
-            """)
-            
-            self.page = await context.new_page()
-            
-            # Configure page-specific settings
-            await self.page.set_extra_http_headers({
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache'
-            })
-            
-            # Set up request interception for Cloudflare
-            await self.page.route("**/*", self._handle_request)
-            
-            logger.info("Browser setup complete")
-            
-    async def _handle_request(self, route, request):
-        """Handle intercepted requests to bypass Cloudflare"""
-        # Skip image and font requests to reduce detection
-        if request.resource_type in ['image', 'font', 'media']:
-            await route.abort()
-            return
-            
-        # Add random delays to appear more human-like
-        await asyncio.sleep(random.uniform(0.1, 0.5))
+    def context_options(self) -> Dict[str, Any]:
+        """Get the options for every Patchright context, pooled or persistent"""
+        return _CONTEXT_OPTIONS
+    
+    async def _release_page(self) -> None:
+        """Hand the tab back, dropping the locators built on it"""
+        self._locator_cache.clear()
+        await super()._release_page()
+
+    async def _research_on_page(self, page: Page, query: str) -> str:
+        """Navigate page to the site, log in if needed and run the query there"""
+        site_config = self.config.site_config
+        site_instructions = self.site_instructions
+        
+        # Navigate to site. Only the DOM is waited for; the login and
+        # research steps below wait for the elements they need themselves.
+        logger.info("Navigating to %s...", site_config.url)
+        await page.goto(site_config.url, wait_until='domcontentloaded', timeout=30000)
+        if not _off_google_accounts(page.url):
+            # Sent to Google's login, so any saved session has expired
+            self._forget_storage_state()
         
-        # Continue with modified headers
-        headers = {
-            **request.headers,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache'
-        }
+        # Handle login if required or should_login is true, unless a saved
+        # session or persistent profile is already signed in
+        if site_config.requires_auth or site_config.should_login:
+            if await self._is_signed_in(page):
+                logger.info("Already signed in, skipping login")
+            else:
+                popup = await site_instructions.handle_login_flow(page)
+                await self._handle_google_login(popup)
+                await popup.wait_for_event('close', timeout=30000)
+                await self._save_storage_state(page.context)
         
-        await route.continue_(headers=headers)
+        # Let scraper handle the research
+        return await site_instructions.handle_research(page, query)
 
-    async def cleanup(self) -> None:
-        """Clean up Patchright resources"""
-        if self.browser:
-            logger.info("Cleaning up resources...")
-            await self.browser.close()
-            self.browser = None
-            self.page = None
-            if self.patchright:
-                await self.patchright.stop()
-                self.patchright = None
-            logger.info("Browser stopped successfully")
+    async def _is_signed_in(self, page: Page) -> bool:
+        """
+        Whether the page already shows a signed-in session. Sites with a
+        signed-in indicator get a short wait for it; others fall back to
+        their instructions' own is_logged_in check, if they have one.
+        """
+        site_instructions = self.site_instructions
+        selectors = getattr(site_instructions, 'selectors', None) or site_instructions.instructions.selectors
+        if selectors.signed_in_indicator:
+            try:
+                await page.locator(selectors.signed_in_indicator).first.wait_for(state='attached', timeout=2000)
+                return True
+            except Exception:
+                return False
+        is_logged_in = getattr(site_instructions, 'is_logged_in', None)
+        return bool(is_logged_in) and await is_logged_in(page)
+
+    async def _save_storage_state(self, context: BrowserContext) -> None:
+        """Save the session after a login so later contexts can start signed in"""
+        path = self.config.storage_state_path
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            await context.storage_state(path=path)
+        except Exception as e:
+            logger.warning("Could not save storage state: %s", e)
+
+    def _forget_storage_state(self) -> None:
+        """Delete a saved session that no longer works"""
+        path = self.config.storage_state_path
+        if path and os.path.exists(path):
+            logger.info("Saved session expired, removing %s", path)
+            os.remove(path)
 
     async def handle_site_specific_research(self, site: ResearchSite, query: str) -> str:
         """Handle research for a specific site"""
-        if site != self.config.site:
+        if site is not self.config.site:
             raise ValueError(f"This driver only handles {self.config.site} research, not {site}")
             
         try:
-            # Navigate to site
-            logger.info(f"Navigating to {self.config.site_config.url}...")
-            await self.page.goto(self.config.site_config.url)
-            await self.page.wait_for_load_state('networkidle')
-            
-            # Handle login if required or should_login is true
-            if self.config.site_config.requires_auth or self.config.site_config.should_login:
-                popup = await self.site_instructions.handle_login_flow(self.page)
-                await self._handle_google_login(popup)
-                await popup.wait_for_event('close', timeout=30000)
-            
-            # Let scraper handle the research
-            return await self.site_instructions.handle_research(self.page, query)
-            
+            # A batch hands back the setup tab, so take one again if needed
+            await self.setup()
+            return await self._research_on_page(self.page, query)
         except Exception as e:
-            logger.error(f"Error during research: {str(e)}")
+            logger.error("Error during research: %s", e)
+            # Don't hand a browser in an unknown state to the next request
+            self._failed = True
             raise
 
     async def execute_research(self, query: str) -> str:
         """Execute research using Patchright"""
         return await self.handle_site_specific_research(self.config.site, query)
 
-    async def navigate_to_site(self) -> None:
-        """Navigate to the target site and handle any challenges"""
-        logger.info(f"Navigating to {self.config.site_config.url}...")
+    async def execute_research_batch(self, queries: List[str]) -> List[str]:
+        """
+        Execute several research queries side by side, each in its own tab of
+        the shared context, with at most config.max_tabs open at once.
+        """
+        await self._open_context()
+        # Hand back the tab taken in setup first: waiting for more tabs while
+        # holding it would deadlock once max_tabs drivers batch on one context
+        await self._release_page()
+        pages = self.page_pool
+        
+        async def run(query: str) -> str:
+            page = await pages.acquire()
+            failed = True
+            try:
+                result = await self._research_on_page(page, query)
+                failed = False
+                return result
+            finally:
+                await pages.release(page, discard=failed)
         
         try:
-            # Navigate with retry logic
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    # Navigate with multiple strategies
-                    for strategy in ['domcontentloaded', 'load', 'networkidle']:
-                        try:
-                            response = await self.page.goto(
-                                self.config.site_config.url,
-                                wait_until=strategy,
-                                timeout=30000
-                            )
-                            
-                            # Check for Cloudflare challenge
-                            if await self._is_cloudflare_challenge():
-                                logger.info("Detected Cloudflare challenge, attempting to solve...")
-                                await self._handle_cloudflare_challenge()
-                            
-                            # Verify we're on the correct page
-                            if await self._verify_page_loaded():
-                                logger.info("Successfully navigated to site")
-                                return
-                                
-                        except Exception as e:
-                            logger.warning(f"Navigation failed with strategy {strategy}: {str(e)}")
-                            continue
-                            
-                    # If we get here, all strategies failed
-                    if attempt < max_retries - 1:
-                        wait_time = (attempt + 1) * 5  # Exponential backoff
-                        logger.info(f"Retrying navigation in {wait_time} seconds...")
-                        await asyncio.sleep(wait_time)
-                    
-                except Exception as e:
-                    logger.error(f"Navigation attempt {attempt + 1} failed: {str(e)}")
-                    if attempt < max_retries - 1:
-                        continue
-                    raise
-                    
+            return await asyncio.gather(*(run(query) for query in queries))
         except Exception as e:
-            logger.error(f"All navigation attempts failed: {str(e)}")
+            logger.error("Error during batch research: %s", e)
+            self._failed = True
             raise
+
+    async def navigate_to_site(self) -> None:
+        """Navigate to the target site and handle any challenges"""
+        url = self.config.site_config.url
+        logger.info("Navigating to %s...", url)
+        
+        # Only failures to navigate at all are retried, with jittered
+        # exponential backoff; each attempt waits just for the response to
+        # commit rather than stacking full page-load timeouts
+        max_retries = self.config.max_retries
+        for attempt in range(max_retries):
+            try:
+                await self.page.goto(url, wait_until='commit', timeout=10000)
+                break
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    logger.error("All navigation attempts failed: %s", e)
+                    raise
+                backoff = min(30, 2 ** attempt + random.random())
+                logger.warning("Navigation attempt %d failed: %s; retrying in %.1f seconds", attempt + 1, e, backoff)
+                await asyncio.sleep(backoff)
+        
+        # Cloudflare answers with its own page (often a 403 or 503), so the
+        # status alone doesn't say whether the site loaded
+        await self.page.wait_for_load_state('domcontentloaded')
+        if await self._is_cloudflare_challenge():
+            logger.info("Detected Cloudflare challenge, attempting to solve...")
+            await self._handle_cloudflare_challenge()
+        
+        # A page that loaded without the site's input is the caller's problem,
+        # not something another navigation would fix
+        if not await self._verify_page_loaded():
+            raise RuntimeError(f"{url} loaded but its input field never appeared")
+        logger.info("Successfully navigated to site")
             
+    def _any_of(self, selectors: Tuple[str, ...]) -> Locator:
+        """Get one locator matching whichever of the selectors is on the page"""
+        return functools.reduce(Locator.or_, map(self.locator, selectors)).first
+        
     async def _is_cloudflare_challenge(self) -> bool:
         """Check if we're on a Cloudflare challenge page"""
+        # The challenge page is served with its indicators in place, so a
+        # count answers straight away instead of waiting out a timeout
         try:
-            # Check for common Cloudflare elements
-            cloudflare_indicators = [
-                "//h1[contains(text(), 'Checking your browser')]",
-                "//h1[contains(text(), 'Just a moment')]",
-                "//div[contains(text(), 'DDoS protection by Cloudflare')]",
-                "#challenge-running",
-                "#challenge-form",
-                "#challenge-stage"
-            ]
-            
-            for indicator in cloudflare_indicators:
-                try:
-                    element = await self.page.wait_for_selector(indicator, timeout=1000)
-                    if element:
-                        return True
-                except:
-                    continue
-                    
-            return False
-            
+            return await self._any_of(CLOUDFLARE_INDICATORS).count() > 0
         except Exception as e:
-            logger.warning(f"Error checking for Cloudflare challenge: {str(e)}")
+            logger.warning("Error checking for Cloudflare challenge: %s", e)
             return False
             
     async def _handle_cloudflare_challenge(self) -> None:
         """Handle Cloudflare challenge page"""
         try:
-            # Wait for initial challenge animation
-            await asyncio.sleep(2)
-            
-            # Wait for challenge to complete
-            success_indicators = [
-                "//h1[contains(text(), 'Please verify you are a human')]",
-                "#success-text",
-                "#challenge-success"
-            ]
-            
-            # Wait for success indicators to disappear
-            max_wait = 30  # Maximum seconds to wait
-            start_time = time.time()
-            
-            while time.time() - start_time < max_wait:
-                challenge_present = False
-                
-                for indicator in success_indicators:
-                    try:
-                        element = await self.page.wait_for_selector(indicator, timeout=1000)
-                        if element:
-                            challenge_present = True
-                            break
-                    except:
-                        continue
-                        
-                if not challenge_present:
-                    logger.info("Cloudflare challenge appears to be solved")
-                    return
-                    
-                await asyncio.sleep(1)
-                
-            raise Exception("Timed out waiting for Cloudflare challenge to complete")
-            
+            # Wait for the challenge indicators to go away
+            await self._any_of(CLOUDFLARE_PENDING_INDICATORS).wait_for(state='hidden', timeout=30000)
+            logger.info("Cloudflare challenge appears to be solved")
         except Exception as e:
-            logger.error(f"Error handling Cloudflare challenge: {str(e)}")
-            raise
+            logger.error("Error handling Cloudflare challenge: %s", e)
+            raise Exception("Timed out waiting for Cloudflare challenge to complete") from e
             
     async def _verify_page_loaded(self) -> bool:
         """Verify we've successfully loaded the target page"""
         try:
-            await self.page.wait_for_load_state('networkidle')
+            # The page is usable once its input shows, however long its
+            # long-polling and analytics requests keep the network busy
+            await self.locator(self.site_instructions.selectors.input_css).first.wait_for(
+                state='visible', timeout=10000
+            )
             return True
         except Exception as e:
-            logger.warning(f"Error verifying page load: {str(e)}")
+            logger.warning("Error verifying page load: %s", e)
             return False
 
     async def _handle_google_login(self, target: Any) -> None:
@@ -436,22 +390,20 @@ class PatchrightDriver(BaseResearchScraper):
             if email_input:
                 await email_input.fill(self.config.google_email)
                 await target.click('button:has-text("Next")')
-                await asyncio.sleep(2)
                 
                 # Wait for password input
                 password_input = await target.wait_for_selector('input[type="password"]', timeout=10000)
                 if password_input:
                     await password_input.fill(self.config.google_password)
                     await target.click('button:has-text("Next")')
-                    await asyncio.sleep(5)
                     
-                    # Handle 2FA if needed
+                    # Handle 2FA if needed; a popup that closes instead has
+                    # finished the login, which ends this wait straight away
                     try:
-                        two_factor_input = await target.wait_for_selector('input[type="tel"]', timeout=5000)
+                        two_factor_input = await target.wait_for_selector('input[type="tel"]', timeout=10000)
                         if two_factor_input and self._2fa_code:
                             await two_factor_input.fill(self._2fa_code)
                             await target.click('button:has-text("Next")')
-                            await asyncio.sleep(5)
                     except Exception:
                         # No 2FA needed
                         pass
@@ -461,71 +413,55 @@ class PatchrightDriver(BaseResearchScraper):
                 raise Exception("Email input not found")
                 
         except Exception as e:
-            logger.error(f"Google login failed: {str(e)}")
+            logger.error("Google login failed: %s", e)
             raise
 
     async def _continue_with_research(self, query: str) -> str:
         """Continue with research after successful login"""
         try:
-            # Wait for pre-input delay
-            await asyncio.sleep(self.site_instructions.navigation.pre_input_wait_time)
+            selectors = self.site_instructions.selectors
             
-            # Find and fill input field
-            input_field = None
-            for selector in self.site_instructions.selectors.input_field:
-                try:
-                    input_field = await self.page.wait_for_selector(selector, state='visible', timeout=5000)
-                    if input_field:
-                        logger.info(f"Found input field with selector: {selector}")
-                        break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} not found: {str(e)}")
-                    continue
-                    
-            if not input_field:
+            # Find the input field with one locator over the union of its
+            # selectors, which resolves on whichever is shown first
+            input_field = self.locator(selectors.input_css).first
+            try:
+                await input_field.wait_for(state='visible', timeout=5000)
+            except Exception:
                 raise Exception("Could not find input field")
+            logger.info("Found input field")
                 
-            # Type query with human-like delays
+            # Fill the query in one call; sites that reject pasted input get
+            # keystrokes instead, paced by Chromium rather than one call per key
             logger.info("Entering query...")
-            await input_field.click()
-            for char in query:
-                await input_field.type(char, delay=random.uniform(50, 150))
+            navigation = self.site_instructions.navigation
+            if navigation.requires_humanized_typing:
+                await input_field.click()
+                await input_field.press_sequentially(query, delay=random.uniform(50, 150))
+            else:
+                await input_field.fill(query)
                 
-            # Wait for post-input delay
-            await asyncio.sleep(self.site_instructions.navigation.post_input_wait_time)
-            
             # Submit query
             logger.info("Submitting query...")
             await input_field.press('Enter')
             
-            # Wait for response with timeout
+            # Wait for the response text to stop changing
             logger.info("Waiting for response...")
-            max_wait = self.site_instructions.navigation.response_wait_time
-            start_time = time.time()
+            max_wait = navigation.response_wait_time
+            response_css = selectors.response_css
+            text = await wait_for_stable_text(self.page, response_css, timeout=max_wait)
             
-            while time.time() - start_time < max_wait:
-                # Check for response content
-                for selector in self.site_instructions.selectors.response_content:
-                    try:
-                        content = await self.page.wait_for_selector(selector, timeout=5000)
-                        if content:
-                            text = await content.text_content()
-                            if text and len(text.strip()) > 0:
-                                logger.info("Found response content")
-                                return text.strip()
-                    except Exception as e:
-                        logger.debug(f"Selector {selector} not found: {str(e)}")
-                        continue
-                        
-                # Check for Cloudflare challenge
-                if await self._is_cloudflare_challenge():
-                    logger.info("Detected Cloudflare challenge during response, attempting to solve...")
-                    await self._handle_cloudflare_challenge()
-                    
-                await asyncio.sleep(1)
+            # A Cloudflare challenge can hold the response back; solve it and wait again
+            if not text.strip() and await self._is_cloudflare_challenge():
+                logger.info("Detected Cloudflare challenge during response, attempting to solve...")
+                await self._handle_cloudflare_challenge()
+                text = await wait_for_stable_text(self.page, response_css, timeout=max_wait)
+            
+            if text.strip():
+                logger.info("Found response content")
+                return text.strip()
                 
             raise Exception(f"No response found after {max_wait} seconds")
             
         except Exception as e:
-            logger.error(f"Research failed: {str(e)}")
+            logger.error("Research failed: %s", e)
             raise 
\ No newline at end of file
@@ -0,0 +1,288 @@
+"""Pools of launched browsers shared across research requests."""
+import asyncio
+import inspect
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+from ..core.config import DEFAULT_MAX_TABS, DEFAULT_POOL_SIZE, DEFAULT_MAX_USES_PER_INSTANCE
+from ....logging_config import setup_logging
+
+if TYPE_CHECKING:
+    from patchright.async_api import Browser, BrowserContext, Page, Playwright
+
+logger = setup_logging(__name__)
+
+# Chromium flags used for every pooled Patchright browser
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-automation',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--enable-javascript',
+    '--no-first-run',
+    '--password-store=basic',
+    '--window-size=1920,1080'
+]
+
+class _NoStackInspect:
+    """The inspect module, except that stack() returns no frames"""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(inspect, name)
+
+    @staticmethod
+    def stack(*args: Any, **kwargs: Any) -> list:
+        return []
+
+def disable_stack_traces() -> None:
+    """
+    Stop Patchright capturing the caller's stack on every API call. It calls
+    inspect.stack() each time only to label calls in traces and error
+    messages, and that dominates its Python overhead on long scrapes.
+    Process-wide and safe to call repeatedly.
+    """
+    try:
+        from patchright._impl import _connection
+    except ImportError as e:
+        logger.debug("Cannot disable Patchright stack traces: %s", e)
+        return
+    if not isinstance(getattr(_connection, 'inspect', None), _NoStackInspect):
+        _connection.inspect = _NoStackInspect()
+
+class BrowserPool(ABC):
+    """
+    Hands out launched browsers and takes them back when a request is done.
+    Idle browsers are kept per key (e.g. headless mode). A browser is closed
+    instead of returned once it has served max_uses requests, when the
+    request using it failed, or when the pool for its key is already full.
+    """
+
+    def __init__(self):
+        self._idle: Dict[Hashable, asyncio.Queue] = {}
+        self._uses: Dict[int, int] = {}
+
+    @abstractmethod
+    async def _launch(self, key: Hashable) -> Any:
+        """Launch a new browser for key"""
+        pass
+
+    @abstractmethod
+    async def _close(self, browser: Any) -> None:
+        """Shut a browser down"""
+        pass
+
+    def _is_alive(self, browser: Any) -> bool:
+        """Whether a browser can still be handed out"""
+        return True
+
+    def _queue(self, key: Hashable) -> asyncio.Queue:
+        """Get the queue of idle browsers for key"""
+        if key not in self._idle:
+            self._idle[key] = asyncio.Queue()
+        return self._idle[key]
+
+    async def prewarm(self, key: Hashable, count: int = DEFAULT_POOL_SIZE) -> None:
+        """Launch browsers in parallel so later requests don't wait for startup"""
+        if count <= 0:
+            return
+        logger.info("Prewarming %d browser(s)...", count)
+        results = await asyncio.gather(
+            *(self._launch(key) for _ in range(count)),
+            return_exceptions=True
+        )
+        queue = self._queue(key)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("Failed to prewarm browser: %s", result)
+            else:
+                queue.put_nowait(result)
+        logger.info("Browser pool ready with %d browser(s)", queue.qsize())
+
+    async def acquire(self, key: Hashable) -> Any:
+        """Take an idle browser, launching one if none is available"""
+        queue = self._queue(key)
+        while not queue.empty():
+            browser = queue.get_nowait()
+            if self._is_alive(browser):
+                return browser
+            self._uses.pop(id(browser), None)
+        return await self._launch(key)
+
+    async def release(
+        self,
+        key: Hashable,
+        browser: Any,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_uses: int = DEFAULT_MAX_USES_PER_INSTANCE,
+        discard: bool = False
+    ) -> None:
+        """Return a browser to the pool, or close it if it should be recycled"""
+        uses = self._uses.pop(id(browser), 0) + 1
+        queue = self._queue(key)
+        if discard or uses >= max_uses or queue.qsize() >= pool_size or not self._is_alive(browser):
+            await self._close(browser)
+            return
+        self._uses[id(browser)] = uses
+        queue.put_nowait(browser)
+
+    async def close(self) -> None:
+        """Close every idle browser"""
+        for queue in self._idle.values():
+            while not queue.empty():
+                await self._close(queue.get_nowait())
+        self._uses.clear()
+
+class PatchrightBrowserPool(BrowserPool):
+    """
+    Pool of Patchright browsers keyed by headless mode. Also keeps one
+    persistent-profile context per user data directory, since a profile can
+    only be open in one browser at a time; every request using that profile
+    opens its page in the same context.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._playwright: Optional["Playwright"] = None
+        self._start_lock = asyncio.Lock()
+        self._persistent: Dict[str, Tuple["BrowserContext", bool]] = {}
+        self._persistent_lock = asyncio.Lock()
+
+    async def _start(self) -> "Playwright":
+        """Start Patchright on first use"""
+        async with self._start_lock:
+            if self._playwright is None:
+                from patchright.async_api import async_playwright
+                self._playwright = await async_playwright().start()
+        return self._playwright
+
+    async def _launch(self, headless: bool) -> "Browser":
+        """Launch a new browser"""
+        playwright = await self._start()
+        return await playwright.chromium.launch(headless=headless, args=BROWSER_ARGS)
+
+    async def persistent_context(
+        self,
+        user_data_dir: str,
+        headless: bool,
+        on_launch: Callable[["BrowserContext"], Awaitable[None]],
+        **options: Any
+    ) -> "BrowserContext":
+        """
+        Get the context for a persistent profile, launching it on first use.
+        Its HTTP cache and cookies survive between runs, so later requests
+        skip re-downloading static assets and logging in again. on_launch
+        configures a newly launched context before anyone else can use it.
+        Raises ValueError if the profile is already open in the other
+        headless mode.
+        """
+        async with self._persistent_lock:
+            context, launched_headless = self._persistent.get(user_data_dir, (None, headless))
+            if launched_headless != headless:
+                # One profile can't be open in two browsers at once
+                raise ValueError(
+                    f"Profile {user_data_dir} is already open with headless={launched_headless}"
+                )
+            if context is None:
+                playwright = await self._start()
+                logger.info("Launching persistent profile %s", user_data_dir)
+                context = await playwright.chromium.launch_persistent_context(
+                    user_data_dir, headless=headless, args=BROWSER_ARGS, **options
+                )
+                def forget(closed: "BrowserContext") -> None:
+                    if self._persistent.get(user_data_dir, (None,))[0] is closed:
+                        del self._persistent[user_data_dir]
+                context.on("close", forget)
+                await on_launch(context)
+                self._persistent[user_data_dir] = (context, headless)
+            return context
+
+    async def _close(self, browser: "Browser") -> None:
+        await browser.close()
+
+    def _is_alive(self, browser: "Browser") -> bool:
+        return browser.is_connected()
+
+    async def close(self) -> None:
+        """Close every idle browser and persistent profile, and stop Patchright"""
+        await super().close()
+        for context, _ in list(self._persistent.values()):
+            await context.close()
+        self._persistent.clear()
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+class BrowserUseBrowserPool(BrowserPool):
+    """Pool of Browser-Use browsers keyed by (headless, chrome_args)"""
+
+    async def _launch(self, key: Tuple[bool, Tuple[str, ...]]) -> Any:
+        """Create a Browser-Use browser; its Chromium starts on first use"""
+        from browser_use import BrowserConfig, Browser, BrowserContextConfig
+        headless, chrome_args = key
+        context_config = BrowserContextConfig(
+            browser_window_size={'width': 1920, 'height': 1080},
+            wait_for_network_idle_page_load_time=3.0
+        )
+        browser_config = BrowserConfig(
+            headless=headless,
+            disable_security=True,
+            extra_chromium_args=list(chrome_args),
+            new_context_config=context_config
+        )
+        return Browser(config=browser_config)
+
+    async def _close(self, browser: Any) -> None:
+        await browser.close()
+
+class PagePool:
+    """
+    Tabs of one browser context, handed out to at most max_tabs requests at
+    once so concurrent research can't open tabs without bound. A released
+    tab is blanked and kept for the next request rather than closed, so
+    later requests skip opening a new one.
+    """
+
+    def __init__(self, context: "BrowserContext", max_tabs: int = DEFAULT_MAX_TABS):
+        self._context = context
+        self._slots = asyncio.Semaphore(max_tabs)
+        self._idle: Deque["Page"] = deque()
+
+    async def acquire(self) -> "Page":
+        """Take an idle tab, opening one if none is left; waits while max_tabs are out"""
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                page = self._idle.pop()
+                if not page.is_closed():
+                    return page
+            return await self._context.new_page()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, page: "Page", discard: bool = False) -> None:
+        """Blank a tab and keep it for reuse, or close it if discard is set"""
+        try:
+            if page.is_closed():
+                return
+            if discard:
+                await page.close()
+                return
+            try:
+                await page.goto('about:blank')
+            except Exception as e:
+                logger.warning("Closing tab that could not be reset: %s", e)
+                await page.close()
+                return
+            self._idle.append(page)
+        finally:
+            self._slots.release()
+
+# Process-wide pools used by the drivers
+patchright_pool = PatchrightBrowserPool()
+browser_use_pool = BrowserUseBrowserPool()
@@ -0,0 +1,171 @@
+"""Patchright context setup and teardown shared by the Patchright driver and site scrapers."""
+import os
+import re
+import weakref
+from typing import Any, Dict, Hashable, Optional, Type
+from patchright.async_api import Browser, BrowserContext, Page
+
+from ....logging_config import setup_logging
+from ..core.auth import GeminiAuth
+from ..core.base import BaseResearchScraper
+from ..core.config import BLOCKED_EXTENSIONS, BLOCKED_HOSTS, ScraperConfig
+from ..core.evasion import EVASION_SCRIPT
+# Only the pool module is needed, which imports nothing from the sites, so
+# this is safe while the drivers package is still importing the site modules
+from ..drivers.pool import PagePool, disable_stack_traces, patchright_pool
+
+logger = setup_logging(__name__)
+
+# Contexts shared by the requests on a pooled browser, keyed by the scraper
+# class and the config values they were built from (account, storage state
+# file, resource blocking), so requests for another account, site scraper
+# or blocking setting never reuse them. Each is created, with its headers
+# and evasion script, the first time it is needed and goes away with the
+# browser when the pool closes it.
+_CONTEXTS: "weakref.WeakKeyDictionary[Browser, Dict[Hashable, BrowserContext]]" = weakref.WeakKeyDictionary()
+
+# Tabs of each shared or persistent context, reused across requests. Idle
+# tabs hold on to their context, so a pool is dropped when its context closes
+# rather than through a weak reference.
+_PAGE_POOLS: Dict[BrowserContext, PagePool] = {}
+
+# Images, fonts, media and trackers, none of which the text scrape needs.
+# Routed by pattern so every other request goes straight to the network
+# instead of through a Python callback.
+_BLOCKED_FILES = re.compile(r"\.(?:%s)(?:[?#]|$)" % "|".join(BLOCKED_EXTENSIONS))
+_BLOCKED_TRACKERS = re.compile("|".join(map(re.escape, BLOCKED_HOSTS)))
+
+async def _abort(route: Any) -> None:
+    """Drop a blocked request"""
+    await route.abort()
+
+class _PatchrightBase(BaseResearchScraper):
+    """
+    Base for the Patchright driver and site scrapers. Each request takes a tab
+    of the persistent profile, or of a shared context on a browser from the
+    Patchright pool, and hands both back in cleanup; a request that failed
+    has its tab and browser discarded instead. Subclasses supply their
+    context options and auth handler class, and implement the site's
+    research flow.
+    """
+
+    __slots__ = ('browser', 'context', 'page', '_failed')
+
+    # Auth handler built on the scraper's page; None for scrapers that don't log in
+    AUTH_CLASS: Optional[Type[GeminiAuth]] = None
+
+    def __init__(self, config: Optional[ScraperConfig] = None):
+        super().__init__(config)
+        self.browser = None
+        self.context = None
+        self.page = None
+        self._failed = False
+
+    @property
+    def auth(self) -> Optional[GeminiAuth]:
+        """Get the auth handler for sites that require a login"""
+        if self.AUTH_CLASS is None or not self.config.site_config.requires_auth:
+            return None
+        if not self._auth:
+            if not self.page:
+                raise RuntimeError("Browser page not initialized")
+            self._auth = self.AUTH_CLASS(self.config, self.page)
+        return self._auth
+
+    def context_options(self) -> Dict[str, Any]:
+        """Get the options for the scraper's browser context"""
+        return {'viewport': self.config.viewport}
+
+    @property
+    def context_key(self) -> Hashable:
+        """Key identifying the shared contexts this scraper can reuse"""
+        config = self.config
+        return (type(self), config.google_email, config.storage_state_path, config.block_resources)
+
+    async def _prepare_context(self, context: BrowserContext) -> None:
+        """Add the evasion script and resource blocking to a newly created context"""
+        logger.info("Adding evasion scripts...")
+        await context.add_init_script(EVASION_SCRIPT)
+        if self.config.block_resources:
+            await context.route(_BLOCKED_FILES, _abort)
+            await context.route(_BLOCKED_TRACKERS, _abort)
+
+    async def setup(self) -> None:
+        """Take a tab of the persistent profile or a pooled browser's shared context"""
+        if not self.page:
+            logger.info("Setting up browser...")
+            if self.config.disable_playwright_stack_trace:
+                disable_stack_traces()
+            await self._open_context()
+            self.page = await self.page_pool.acquire()
+            logger.info("Browser setup complete")
+
+    async def _open_context(self) -> None:
+        """Get the persistent profile's context, or take a pooled browser and its shared context"""
+        if not self.context:
+            if self.config.user_data_dir:
+                # Reuse the profile's cookies and HTTP cache from earlier runs
+                self.context = await patchright_pool.persistent_context(
+                    self.config.user_data_dir,
+                    self.config.headless,
+                    self._prepare_context,
+                    **self.context_options()
+                )
+            else:
+                # Take a pre-launched browser from the pool when one is idle
+                self.browser = await patchright_pool.acquire(self.config.headless)
+                self.context = await self._shared_context()
+
+    @property
+    def page_pool(self) -> PagePool:
+        """Get the pool of tabs for this scraper's context"""
+        context = self.context
+        pool = _PAGE_POOLS.get(context)
+        if pool is None:
+            pool = _PAGE_POOLS[context] = PagePool(context, self.config.max_tabs)
+            context.on("close", lambda _: _PAGE_POOLS.pop(context, None))
+        return pool
+
+    async def _shared_context(self) -> BrowserContext:
+        """Get the browser's shared context for this scraper, configuring it on first use"""
+        contexts = _CONTEXTS.setdefault(self.browser, {})
+        key = self.context_key
+        context = contexts.get(key)
+        if context is None:
+            # Start from the cookies of the last login, if one was saved
+            storage_state = self.config.storage_state_path
+            if not (storage_state and os.path.exists(storage_state)):
+                storage_state = None
+            context = await self.browser.new_context(**self.context_options(), storage_state=storage_state)
+            await self._prepare_context(context)
+            contexts[key] = context
+        return context
+
+    async def _release_page(self) -> None:
+        """Hand this scraper's tab back to its context, closing it if the request failed"""
+        page = self.page
+        self.page = None
+        # The auth handler is bound to the tab
+        self._auth = None
+        if page:
+            await self.page_pool.release(page, discard=self._failed)
+
+    async def cleanup(self) -> None:
+        """Hand this request's tab back and return a pooled browser to the pool"""
+        if self.context:
+            logger.info("Cleaning up resources...")
+            try:
+                await self._release_page()
+            finally:
+                # A persistent profile stays open for the next request
+                if self.browser:
+                    await patchright_pool.release(
+                        self.config.headless,
+                        self.browser,
+                        pool_size=self.config.pool_size,
+                        max_uses=self.config.max_uses_per_instance,
+                        discard=self._failed
+                    )
+                    logger.info("Browser released to pool")
+                self.browser = None
+                self.context = None
@@ -1,14 +1,15 @@
 """Gemini-specific implementation for research scraping."""
+import json
 import logging
-import asyncio
-from typing import Optional, Any, List
-from patchright.async_api import async_playwright, Browser, Page
-from dataclasses import dataclass
+from typing import Optional, Any, Dict, List
+from patchright.async_api import Browser, BrowserContext, Page
+from dataclasses import dataclass, field
 
 from .....logging_config import setup_logging
-from ...core.base import BaseResearchScraper
 from ...core.auth import GeminiAuth
 from ...core.config import ScraperConfig, ResearchSite
+from ...core.waits import first_found, wait_for_stable_text
+from ..base import _PatchrightBase
 
 logger = setup_logging(__name__)
 
@@ -23,6 +24,15 @@ class SelectorSet:
     password_input: List[str]
     next_button: List[str]
     two_factor_input: List[str]
+    signed_in_indicator: Optional[str] = None  # Only present once signed in
+
+    # Alternatives joined into single CSS selector lists, built once at import
+    input_css: str = field(init=False, repr=False)
+    response_css: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.input_css = ", ".join(self.input_field)
+        self.response_css = ", ".join(self.response_content)
 
 @dataclass
 class NavigationSteps:
@@ -31,6 +41,7 @@ class NavigationSteps:
     post_input_wait_time: float
     response_wait_time: float
     auth_step_wait_time: float
+    requires_humanized_typing: bool = False  # Type the query key by key instead of filling it
 
 @dataclass
 class DriverInstructions:
@@ -66,7 +77,9 @@ class GeminiSiteInstructions:
                 email_input=['input[type="email"]'],
                 password_input=['input[type="password"]'],
                 next_button=['button:has-text("Next")'],
-                two_factor_input=['input[type="tel"]']
+                two_factor_input=['input[type="tel"]'],
+                # The Google account button in the app bar
+                signed_in_indicator='a[href^="https://accounts.google.com/SignOutOptions"]'
             ),
             navigation=NavigationSteps(
                 pre_input_wait_time=2.0,
@@ -89,18 +102,21 @@ class GeminiSiteInstructions:
             selectors=SelectorSet(
                 input_field=[
                     'textarea[aria-label*="chat input"]',
-                    'textarea[placeholder*="Enter a prompt"]',
-                    'Enter a prompt here'  # For fuzzy text matching
+                    'textarea[placeholder*="Enter a prompt"]'
                 ],
                 submit_button=None,
                 response_content=[
                     '.chat-message[role="presentation"]',
                     '.response-content'
                 ],
-                sign_in_button=['Sign in'],  # For fuzzy text matching
-                email_input=['input[type="email"]', 'email'],
-                password_input=['input[type="password"]', 'password'],
-                next_button=['Next'],  # For fuzzy text matching
+                sign_in_button=[
+                    'a[href*="ServiceLogin"]',
+                    '[data-test-id="action-button"]',
+                    'button[aria-label*="Sign in"]'
+                ],
+                email_input=['input[type="email"]'],
+                password_input=['input[type="password"]'],
+                next_button=['#identifierNext button', '#passwordNext button', '#totpNext button'],
                 two_factor_input=['input[type="tel"]']
             ),
             navigation=NavigationSteps(
@@ -115,11 +131,40 @@ class GeminiSiteInstructions:
         @staticmethod
         async def submit_query(page: Any, query: str) -> None:
             """How to submit a query using NoDriver"""
-            input_elem = await page.select('textarea')
+            input_elem = await page.query_selector(GeminiSiteInstructions.NoDriver.instructions.selectors.input_css)
             if not input_elem:
+                # NoDriver's fallback to fuzzy text matching
                 input_elem = await page.find("Enter a prompt here", best_match=True)
             await input_elem.send_keys(query)
             await input_elem.send_keys("\n")
+        
+        # The answer streams back from this endpoint, so it can be read off
+        # the network instead of from the rendered page
+        RESPONSE_URL = 'StreamGenerate'
+        
+        @staticmethod
+        def parse_response(body: str) -> str:
+            """
+            Extract the answer text from a StreamGenerate body. The body is a
+            series of length-prefixed JSON frames, each carrying the answer so
+            far as a JSON string; the last one holds the full text.
+            """
+            text = ''
+            for line in body.splitlines():
+                if not line.startswith('['):
+                    continue
+                try:
+                    frames = json.loads(line)
+                except ValueError:
+                    continue
+                for frame in frames:
+                    if not (isinstance(frame, list) and len(frame) > 2 and isinstance(frame[2], str)):
+                        continue
+                    try:
+                        text = json.loads(frame[2])[4][0][1][0] or text
+                    except (ValueError, IndexError, KeyError, TypeError):
+                        continue
+            return text
     
     class BrowserUse:
         """Instructions specific to Browser-Use automation"""
@@ -173,62 +218,61 @@ class GeminiSiteInstructions:
 class GeminiPatchrightAuth(GeminiAuth):
     """Patchright-specific implementation of Gemini authentication"""
     
+    __slots__ = ('page',)
+    
     def __init__(self, config: ScraperConfig, page: Page):
         super().__init__(config)
         self.page = page
         
     async def navigate_to_login(self) -> None:
         """Navigate to Google login page"""
-        try:
-            # Try the action button first
-            await self.page.wait_for_selector('[data-test-id="action-button"]', timeout=5000)
-            await self.page.locator('[data-test-id="action-button"]').click()
-        except Exception:
+        if not self.page.url.startswith("https://accounts.google.com"):
+            # Either the action button or the link version, whichever shows up
+            sign_in = self.page.locator('[data-test-id="action-button"]').or_(
+                self.page.get_by_role("link", name="Sign in")
+            )
             try:
-                # Try the link version
-                await self.page.wait_for_selector('a:has-text("Sign in")', timeout=5000)
-                await self.page.get_by_role("link", name="Sign in").click()
+                await sign_in.first.click(timeout=10000)
             except Exception:
-                # We might already be on the login page
+                # We might already be on the way to the login page
                 pass
         
         # Wait for the login page to load
-        await self.page.wait_for_url("**/accounts.google.com/**", timeout=10000)
-        
-        # Check if we're already on the login page
-        current_url = self.page.url
-        if not current_url.startswith("https://accounts.google.com"):
+        try:
+            await self.page.wait_for_url("https://accounts.google.com/**", timeout=10000)
+        except Exception:
             raise RuntimeError("Failed to reach Google login page")
 
     async def enter_email(self) -> None:
         """Enter email and proceed"""
-        await self.page.wait_for_selector('input[type="email"]', timeout=5000)
-        await self.page.fill('input[type="email"]', self.config.google_email)
+        await self.page.fill('input[type="email"]', self.config.google_email, timeout=10000)
         await self.page.click('button:has-text("Next")')
-        await self.page.wait_for_selector('input[type="password"]', timeout=5000)
+        await self.page.wait_for_selector('input[type="password"]', state='visible', timeout=10000)
+
+    async def _wait_for_url_off_accounts(self) -> bool:
+        """Wait until Google hands the page back to Gemini"""
+        await self.page.wait_for_url(
+            lambda url: not url.startswith("https://accounts.google.com"), timeout=15000
+        )
+        return True
 
     async def enter_password(self) -> None:
         """Enter password and submit"""
         await self.page.fill('input[type="password"]', self.config.google_password)
         await self.page.click('button:has-text("Next")')
-        # Wait for either 2FA input or successful redirect
-        try:
-            await self.page.wait_for_url("**/bard.google.com/**", timeout=10000)
-        except Exception:
-            # Might need 2FA
-            pass
+        # Next comes either a 2FA prompt or the redirect back to Gemini
+        await first_found(
+            self.page.wait_for_selector('input[type="tel"]', timeout=15000),
+            self._wait_for_url_off_accounts()
+        )
 
     async def handle_2fa(self) -> None:
         """Handle 2FA if required"""
-        if self._2fa_code:
-            try:
-                await self.page.wait_for_selector('input[type="tel"]', timeout=5000)
-                await self.page.fill('input[type="tel"]', self._2fa_code)
-                await self.page.click('button:has-text("Next")')
-                await self.page.wait_for_url("**/bard.google.com/**", timeout=10000)
-            except Exception:
-                # No 2FA prompt found
-                pass
+        # enter_password has already waited for the prompt, so just check for it
+        if self._2fa_code and await self.page.query_selector('input[type="tel"]'):
+            await self.page.fill('input[type="tel"]', self._2fa_code)
+            await self.page.click('button:has-text("Next")')
+            await self._wait_for_url_off_accounts()
 
     async def verify_login_success(self) -> bool:
         """Verify successful login"""
@@ -239,180 +283,120 @@ class GeminiPatchrightAuth(GeminiAuth):
         except Exception:
             return False
 
-class GeminiScraper(BaseResearchScraper):
+async def _log_request(request: Any) -> None:
+    """Log a request's details"""
+    logger.debug("=== REQUEST DETAILS ===")
+    logger.debug("URL: %s", request.url)
+    logger.debug("Method: %s", request.method)
+    logger.debug("Headers:")
+    for key, value in request.headers.items():
+        logger.debug("  %s: %s", key, value)
+    if request.post_data:
+        logger.debug("Post data: %s", request.post_data)
+
+    # Log resource type and frame info
+    logger.debug("Resource type: %s", request.resource_type)
+    logger.debug("Is navigation request: %s", request.is_navigation_request())
+
+async def _log_response(response: Any) -> None:
+    """Log a response's headers and the context's cookies"""
+    logger.debug("=== RESPONSE DETAILS ===")
+    logger.debug("URL: %s", response.url)
+    logger.debug("Status: %s", response.status)
+    logger.debug("Response headers:")
+    headers = await response.all_headers()
+    for key, value in headers.items():
+        logger.debug("  %s: %s", key, value)
+
+    # Get cookies from response
+    context = response.request.frame.page.context
+    cookies = await context.cookies()
+    if cookies:
+        logger.debug("Cookies:")
+        for cookie in cookies:
+            logger.debug("  %s: %s", cookie['name'], cookie['value'])
+            logger.debug("    Domain: %s", cookie['domain'])
+            logger.debug("    Path: %s", cookie['path'])
+            logger.debug("    Secure: %s", cookie['secure'])
+            logger.debug("    HttpOnly: %s", cookie['httpOnly'])
+
+async def _log_request_error(error: Any) -> None:
+    """Log a failed request"""
+    logger.error("=== REQUEST ERROR ===")
+    request = error.request
+    logger.error("Failed URL: %s", request.url)
+    logger.error("Error text: %s", error.error_text)
+    logger.debug("Request headers:")
+    for key, value in request.headers.items():
+        logger.debug("  %s: %s", key, value)
+
+class GeminiScraper(_PatchrightBase):
     """Gemini implementation of research scraper"""
     
-    def __init__(self, config: Optional[ScraperConfig] = None):
-        super().__init__(config)
-        self.patchright = None
-        self.browser = None
-        self.page = None
+    __slots__ = ()
+    
+    AUTH_CLASS = GeminiPatchrightAuth
+    
+    def context_options(self) -> Dict[str, Any]:
+        """Get the context options, matching a desktop Chrome on macOS"""
+        return dict(
+            viewport={"width": 1920, "height": 1080},
+            java_script_enabled=True,
+            bypass_csp=True,
+            ignore_https_errors=True,
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36',
+            locale='en-US',
+            timezone_id='America/Los_Angeles',
+            permissions=['geolocation', 'notifications'],
+            extra_http_headers={
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+                'Accept-Encoding': 'gzip, deflate, br, zstd',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+                'sec-ch-ua': '"Not A(Brand";v="8", "Chromium";v="132", "Google Chrome";v="132"',
+                'sec-ch-ua-arch': '"arm"',
+                'sec-ch-ua-bitness': '"64"',
+                'sec-ch-ua-form-factors': '"Desktop"',
+                'sec-ch-ua-full-version': '"132.0.6834.160"',
+                'sec-ch-ua-full-version-list': '"Not A(Brand";v="8.0.0.0", "Chromium";v="132.0.6834.160", "Google Chrome";v="132.0.6834.160"',
+                'sec-ch-ua-mobile': '?0',
+                'sec-ch-ua-model': '""',
+                'sec-ch-ua-platform': '"macOS"',
+                'sec-ch-ua-platform-version': '"15.3.0"',
+                'sec-ch-ua-wow64': '?0',
+                'sec-fetch-dest': 'document',
+                'sec-fetch-mode': 'navigate',
+                'sec-fetch-site': 'none',
+                'sec-fetch-user': '?1',
+                'x-browser-channel': 'stable',
+                'x-browser-copyright': 'Copyright 2025 Google LLC. All rights reserved.',
+            }
+        )
+    
+    async def _prepare_context(self, context: BrowserContext) -> None:
+        """Set any initial cookies from the config, hook up request logging, then add the evasion scripts"""
+        if self.config.auth_cookies:
+            logger.info("Setting authentication cookies from config...")
+            await context.add_cookies(self.config.auth_cookies)
         
-    @property
-    def auth(self) -> Optional[GeminiAuth]:
-        """Get Gemini auth handler"""
-        if not self._auth:
-            if not self.page:
-                raise RuntimeError("Browser page not initialized")
-            self._auth = GeminiPatchrightAuth(self.config, self.page)
-        return self._auth
+        # Request/response logging is hooked on the context, so tabs reused
+        # across requests don't collect a listener each time. Dumping every
+        # response costs extra round trips for its headers and cookies, so it
+        # is only hooked up when debug logging is on.
+        if logger.isEnabledFor(logging.DEBUG):
+            context.on("request", _log_request)
+            context.on("response", _log_response)
+        context.on("requestfailed", _log_request_error)
+        await super()._prepare_context(context)
         
     async def setup(self) -> None:
         """Initialize Patchright browser for Gemini"""
         logger.info("Starting Patchright browser for Gemini...")
         try:
-            logger.info("Initializing Playwright...")
-            self.patchright = await async_playwright().start()
-            
-            logger.info("Launching browser with anti-detection settings...")
-            self.browser = await self.patchright.chromium.launch(
-                headless=self.config.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-software-rasterizer',
-                    '--disable-extensions',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-automation',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins,site-per-process',
-                    '--disable-blink-features=AutomationControlled',
-                    '--ignore-certificate-errors',
-                    '--no-first-run',
-                    '--no-service-autorun',
-                    '--password-store=basic'
-                ]
-            )
-            
-            logger.info("Creating browser context...")
-            context = await self.browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                java_script_enabled=True,
-                bypass_csp=True,
-                ignore_https_errors=True,
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36',
-                locale='en-US',
-                timezone_id='America/Los_Angeles',
-                permissions=['geolocation', 'notifications'],
-                extra_http_headers={
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                    'Accept-Encoding': 'gzip, deflate, br, zstd',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'sec-ch-ua': '"Not A(Brand";v="8", "Chromium";v="132", "Google Chrome";v="132"',
-                    'sec-ch-ua-arch': '"arm"',
-                    'sec-ch-ua-bitness': '"64"',
-                    'sec-ch-ua-form-factors': '"Desktop"',
-                    'sec-ch-ua-full-version': '"132.0.6834.160"',
-                    'sec-ch-ua-full-version-list': '"Not A(Brand";v="8.0.0.0", "Chromium";v="132.0.6834.160", "Google Chrome";v="132.0.6834.160"',
-                    'sec-ch-ua-mobile': '?0',
-                    'sec-ch-ua-model': '""',
-                    'sec-ch-ua-platform': '"macOS"',
-                    'sec-ch-ua-platform-version': '"15.3.0"',
-                    'sec-ch-ua-wow64': '?0',
-                    'sec-fetch-dest': 'document',
-                    'sec-fetch-mode': 'navigate',
-                    'sec-fetch-site': 'none',
-                    'sec-fetch-user': '?1',
-                    'x-browser-channel': 'stable',
-                    'x-browser-copyright': 'Copyright 2025 Google LLC. All rights reserved.',
-                }
-            )
-            
-            # Set initial cookies if provided in config
-            if self.config.auth_cookies:
-                logger.info("Setting authentication cookies from config...")
-                await context.add_cookies(self.config.auth_cookies)
-            
-            logger.info("Adding evasion scripts...")
-            await context.add_init_script("""
-                // Override property
-                const newProto = navigator.__proto__;
-                delete newProto.webdriver;
-                navigator.__proto__ = newProto;
-                
-                // Add language
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-                
-                // Add plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                
-                // Add Chrome
-                window.chrome = {
-                    runtime: {},
-                    loadTimes: function() {},
-                    csi: function() {},
-                    app: {}
-                };
-                
-                // Modify permissions
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                    Promise.resolve({state: Notification.permission}) :
-                    originalQuery(parameters)
-                );
-            """)
-            
-            logger.info("Creating new page...")
-            self.page = await context.new_page()
-            
-            # Enable request/response logging
-            async def log_request(request):
-                logger.info("=== REQUEST DETAILS ===")
-                logger.info(f"URL: {request.url}")
-                logger.info(f"Method: {request.method}")
-                logger.info("Headers:")
-                for key, value in request.headers.items():
-                    logger.info(f"  {key}: {value}")
-                if request.post_data:
-                    logger.info(f"Post data: {request.post_data}")
-                
-                # Log resource type and frame info
-                logger.info(f"Resource type: {request.resource_type}")
-                logger.info(f"Is navigation request: {request.is_navigation_request()}")
-            
-            async def log_response(response):
-                logger.info("=== RESPONSE DETAILS ===")
-                logger.info(f"URL: {response.url}")
-                logger.info(f"Status: {response.status}")
-                logger.info("Response headers:")
-                headers = await response.all_headers()
-                for key, value in headers.items():
-                    logger.info(f"  {key}: {value}")
-                
-                # Get cookies from response
-                context = response.request.frame.page.context
-                cookies = await context.cookies()
-                if cookies:
-                    logger.info("Cookies:")
-                    for cookie in cookies:
-                        logger.info(f"  {cookie['name']}: {cookie['value']}")
-                        logger.info(f"    Domain: {cookie['domain']}")
-                        logger.info(f"    Path: {cookie['path']}")
-                        logger.info(f"    Secure: {cookie['secure']}")
-                        logger.info(f"    HttpOnly: {cookie['httpOnly']}")
-            
-            async def log_error(error):
-                logger.error("=== REQUEST ERROR ===")
-                request = error.request
-                logger.error(f"Failed URL: {request.url}")
-                logger.error(f"Error text: {error.error_text}")
-                logger.error("Request headers:")
-                for key, value in request.headers.items():
-                    logger.error(f"  {key}: {value}")
-            
-            self.page.on("request", log_request)
-            self.page.on("response", log_response)
-            self.page.on("requestfailed", log_error)
+            await super().setup()
             
-            logger.info(f"Navigating to Gemini...")
+            logger.info("Navigating to Gemini...")
             try:
                 # Try direct access first
                 logger.info("Attempting direct access with cookies...")
@@ -427,72 +411,58 @@ class GeminiScraper(BaseResearchScraper):
                 await self.login()
                 
             except Exception as e:
-                logger.error(f"Failed to access Gemini: {str(e)}")
+                logger.error("Failed to access Gemini: %s", e)
                 current_url = self.page.url
-                logger.error(f"Current URL: {current_url}")
+                logger.error("Current URL: %s", current_url)
                 raise
                 
             logger.info("Browser setup completed successfully")
         except Exception as e:
-            logger.error(f"Browser startup error: {str(e)}")
+            logger.error("Browser startup error: %s", e)
+            # Don't hand a browser in an unknown state to the next request
+            self._failed = True
             raise
 
-    async def cleanup(self) -> None:
-        """Clean up Patchright resources"""
-        if self.browser:
-            logger.info("Cleaning up resources...")
-            await self.browser.close()
-            self.browser = None
-            self.page = None
-            if self.patchright:
-                await self.patchright.stop()
-                self.patchright = None
-            logger.info("Browser stopped successfully")
-
     async def handle_site_specific_research(self, site: ResearchSite, query: str) -> str:
         """Handle research for Gemini"""
-        if site != ResearchSite.GEMINI:
+        if site is not ResearchSite.GEMINI:
             raise ValueError(f"This scraper only handles Gemini research, not {site}")
             
         try:
-            # Wait for and handle any welcome/intro modals
-            try:
-                welcome_button = await self.page.get_by_text("Got it", exact=True)
-                if welcome_button:
-                    await welcome_button.click()
-                    await asyncio.sleep(1)
-            except Exception:
-                pass  # No welcome modal found
+            # Dismiss the welcome/intro modal if it is showing; click() waits
+            # for the button to be actionable, so no extra delay is needed
+            welcome_button = self.page.get_by_text("Got it", exact=True)
+            if await welcome_button.count():
+                await welcome_button.first.click()
             
             # Look for input field and enter query
             logger.info("Looking for query input field...")
-            input_elem = await self.page.locator('textarea[aria-label*="chat input"]').first
-            if not input_elem:
-                input_elem = await self.page.locator('textarea[placeholder*="Enter a prompt"]').first
+            selectors = GeminiSiteInstructions.Patchright.instructions.selectors
+            try:
+                input_elem = await self.page.wait_for_selector(selectors.input_css, state='visible', timeout=10000)
+            except Exception:
+                input_elem = None
             
             if input_elem:
                 logger.info("Found input field, entering query...")
                 await input_elem.fill(query)
                 await input_elem.press('Enter')
                 
-                # Wait for response
+                # Wait for the latest chat message to stop changing
                 logger.info("Waiting for response...")
-                await asyncio.sleep(10)
-                
-                # Look for results in the chat container
-                logger.info("Looking for response content...")
-                results = await self.page.locator('.chat-message[role="presentation"]').last.text_content()
+                results = await wait_for_stable_text(self.page, selectors.response_css, timeout=10.0)
                 if results:
                     logger.info("Found results")
                     return results
                 
-                logger.warning("No results found")
-                return "No results found"
+                raise RuntimeError("No results found")
             else:
                 raise RuntimeError("Query input not found")
             
         except Exception as e:
-            logger.error(f"Query submission error: {str(e)}")
+            logger.error("Query submission error: %s", e)
+            # Don't hand a browser in an unknown state to the next request
+            self._failed = True
             raise
     
     async def execute_research(self, query: str) -> str:
@@ -1,14 +1,15 @@
 """Perplexity-based implementation for research scraping."""
+import json
 import logging
-from typing import Optional, Any, List
-from dataclasses import dataclass
+from typing import Optional, Any, Dict, List
+from dataclasses import dataclass, field
 import asyncio
 import random
-import time
 
 from .....logging_config import setup_logging
-from ...core.base import BaseResearchScraper
 from ...core.config import ScraperConfig, ResearchSite
+from ...core.waits import first_visible, wait_for_stable_text
+from ..base import _PatchrightBase
 
 logger = setup_logging(__name__)
 
@@ -18,6 +19,15 @@ class SelectorSet:
     input_field: List[str]
     submit_button: Optional[str]
     response_content: List[str]
+    signed_in_indicator: Optional[str] = None  # Only present once signed in
+
+    # Alternatives joined into single CSS selector lists, built once at import
+    input_css: str = field(init=False, repr=False)
+    response_css: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.input_css = ", ".join(self.input_field)
+        self.response_css = ", ".join(self.response_content)
 
 @dataclass
 class NavigationSteps:
@@ -25,6 +35,7 @@ class NavigationSteps:
     pre_input_wait_time: float
     post_input_wait_time: float
     response_wait_time: float
+    requires_humanized_typing: bool = False  # Type the query key by key instead of filling it
 
 @dataclass
 class DriverInstructions:
@@ -69,48 +80,54 @@ class PerplexitySiteInstructions:
             response_wait_time=15.0
         )
 
+        # Buttons and links that open the login dialog; only shown signed out
+        login_selectors = [
+            'button:has-text("Log in")',
+            'button:has-text("Login")',
+            'button:has-text("Sign in")',
+            'a:has-text("Log in")',
+            'a:has-text("Login")',
+            'a:has-text("Sign in")'
+        ]
+
+        @staticmethod
+        async def is_logged_in(page: Any) -> bool:
+            """Whether the page shows a signed-in session: the input is up and no login button is"""
+            instructions = PerplexitySiteInstructions.Patchright
+            try:
+                await page.wait_for_selector(instructions.selectors.input_css, state='visible', timeout=10000)
+            except Exception:
+                return False
+            return not await page.locator(", ".join(instructions.login_selectors)).first.is_visible()
+
         @staticmethod
         async def handle_login_flow(page: Any) -> Any:
             """Handle the entire login flow until Google popup"""
             logger.info("Starting login flow...")
             
-            # Find and click login button
-            login_selectors = [
-                'button:has-text("Log in")',
-                'button:has-text("Login")',
-                'button:has-text("Sign in")',
-                'a:has-text("Log in")',
-                'a:has-text("Login")',
-                'a:has-text("Sign in")'
-            ]
-            
-            # Try each login selector
-            for selector in login_selectors:
+            # Probe every login selector at once and use whichever shows up first
+            found = await first_visible(page, PerplexitySiteInstructions.Patchright.login_selectors, timeout=5.0)
+            if found:
+                selector, login_button = found
                 try:
-                    login_button = await page.wait_for_selector(selector, timeout=5000, state='visible')
-                    if login_button:
-                        logger.info(f"Found login button with selector: {selector}")
-                        # Move mouse like a human would
-                        box = await login_button.bounding_box()
-                        if box:
-                            await page.mouse.move(
-                                box['x'] + box['width'] / 2,
-                                box['y'] + box['height'] / 2,
-                                steps=10
-                            )
-                            await asyncio.sleep(0.1)
-                        await login_button.click()
-                        break
-                except Exception:
-                    continue
-            
-            # Wait for modal to appear and stabilize
-            logger.info("Waiting for login modal to stabilize...")
-            await asyncio.sleep(2)
+                    logger.info("Found login button with selector: %s", selector)
+                    # Move mouse like a human would
+                    box = await login_button.bounding_box()
+                    if box:
+                        await page.mouse.move(
+                            box['x'] + box['width'] / 2,
+                            box['y'] + box['height'] / 2,
+                            steps=10
+                        )
+                        await asyncio.sleep(0.1)
+                    await login_button.click()
+                except Exception as e:
+                    logger.debug("Login button click failed: %s", e)
             
             # Find and click Google login
             logger.info("Looking for Google login button...")
             
+            google_page = None
             try:
                 # Add more human-like browser properties
                 await page.evaluate('''() => {
@@ -145,19 +162,33 @@ class PerplexitySiteInstructions:
                     };
                 }''')
                 
-                # Create new page for Google login
-                context = page.context
-                google_page = await context.new_page()
-                await google_page.goto('https://accounts.google.com')
+                # Open the Google login page while waiting for the button to
+                # become visible; neither step depends on the other
+                async def open_google_page() -> Any:
+                    new_page = await page.context.new_page()
+                    try:
+                        await new_page.goto('https://accounts.google.com')
+                    except BaseException:
+                        await new_page.close()
+                        raise
+                    return new_page
                 
-                # Wait for button to be ready and visible
-                google_button = await page.wait_for_selector('button:has-text("Continue with Google")', state='visible', timeout=5000)
+                opened, google_button = await asyncio.gather(
+                    open_google_page(),
+                    page.wait_for_selector('button:has-text("Continue with Google")', state='visible', timeout=5000),
+                    return_exceptions=True
+                )
+                if not isinstance(opened, BaseException):
+                    google_page = opened
+                for result in (opened, google_button):
+                    if isinstance(result, BaseException):
+                        raise result
                 
                 if not google_button:
                     raise Exception("Could not find Google login button")
                 
                 # Wait for any animations to complete
-                await asyncio.sleep(1)
+                await google_button.wait_for_element_state('stable')
                 
                 # Get button position for human-like interaction
                 box = await google_button.bounding_box()
@@ -202,9 +233,6 @@ class PerplexitySiteInstructions:
                     }
                 }''')
                 
-                # Wait for styles to apply
-                await asyncio.sleep(0.5)
-                
                 # Click with JavaScript to ensure the event triggers
                 await page.evaluate('''() => {
                     const buttons = Array.from(document.querySelectorAll('button'));
@@ -227,13 +255,17 @@ class PerplexitySiteInstructions:
                 
                 logger.info("Successfully clicked Google button")
                 
-                # Wait for Google login page to load
-                await google_page.wait_for_load_state('networkidle')
+                # Wait for the Google login page's DOM; the login steps wait
+                # for their own fields
+                await google_page.wait_for_load_state('domcontentloaded')
                 
                 return google_page
                 
             except Exception as e:
-                logger.error(f"Error during Google login: {str(e)}")
+                logger.error("Error during Google login: %s", e)
+                # The tab would otherwise outlive the request in a shared context
+                if google_page:
+                    await google_page.close()
                 raise Exception("Could not click Google login button")
 
         @staticmethod
@@ -241,28 +273,13 @@ class PerplexitySiteInstructions:
             """Handle the entire research flow after login"""
             logger.info("Starting research flow...")
             
-            # Find input field
-            input_selectors = [
-                'textarea[placeholder*="Ask anything"]',
-                'textarea[placeholder*="Message Perplexity"]',
-                'textarea[placeholder*="Ask"]',
-                'textarea[placeholder*="Message"]',
-                'textarea[role="textbox"]',
-                'textarea',
-                '[contenteditable="true"]',
-                '[role="textbox"]'
-            ]
+            selectors = PerplexitySiteInstructions.Patchright.selectors
             
-            # Try each input selector
-            input_field = None
-            for selector in input_selectors:
-                try:
-                    input_field = await page.wait_for_selector(selector, timeout=5000, state='visible')
-                    if input_field:
-                        logger.info(f"Found input field with selector: {selector}")
-                        break
-                except Exception:
-                    continue
+            # Wait for whichever input selector shows up first
+            try:
+                input_field = await page.wait_for_selector(selectors.input_css, timeout=5000, state='visible')
+            except Exception:
+                input_field = None
             
             if not input_field:
                 raise Exception("Could not find input field")
@@ -273,33 +290,12 @@ class PerplexitySiteInstructions:
             await input_field.fill(query)
             await input_field.press('Enter')
             
-            # Wait for response
+            # Wait for the response text to stop changing
             logger.info("Waiting for response...")
-            response_selectors = [
-                '.response-content',
-                '[data-message-author-role="assistant"]',
-                '.prose',
-                '.markdown-content',
-                '[role="article"]',
-                '[role="presentation"]'
-            ]
-            
-            # Try to get response with timeout
-            start_time = time.time()
-            max_wait = 15.0
-            
-            while time.time() - start_time < max_wait:
-                for selector in response_selectors:
-                    try:
-                        content = await page.wait_for_selector(selector, timeout=5000)
-                        if content:
-                            text = await content.text_content()
-                            if text and len(text.strip()) > 0:
-                                logger.info("Found response content")
-                                return text.strip()
-                    except Exception:
-                        continue
-                await asyncio.sleep(1)
+            text = await wait_for_stable_text(page, selectors.response_css, timeout=15.0)
+            if text and text.strip():
+                logger.info("Found response content")
+                return text.strip()
             
             raise Exception("No response found after timeout")
     
@@ -322,6 +318,36 @@ class PerplexitySiteInstructions:
             post_input_wait_time=2.0,
             response_wait_time=10.0
         )
+        
+        # The answer streams back from this endpoint as server-sent events,
+        # so it can be read off the network instead of from the rendered page
+        RESPONSE_URL = 'perplexity_ask'
+        
+        @staticmethod
+        def parse_response(body: str) -> str:
+            """
+            Extract the answer text from a perplexity_ask event stream. Each
+            event carries the answer so far; the last one holds the full text.
+            """
+            text = ''
+            for line in body.splitlines():
+                if not line.startswith('data:'):
+                    continue
+                try:
+                    event = json.loads(line[len('data:'):])
+                except ValueError:
+                    continue
+                if not isinstance(event, dict):
+                    continue
+                answer = event.get('answer')
+                if not answer and isinstance(event.get('text'), str):
+                    # Older events wrap the answer in a JSON-encoded text field
+                    try:
+                        answer = json.loads(event['text']).get('answer')
+                    except (ValueError, AttributeError):
+                        answer = event['text']
+                text = answer or text
+            return text
     
     class BrowserUse:
         """Instructions specific to Browser-Use automation"""
@@ -343,122 +369,77 @@ class PerplexitySiteInstructions:
             response_wait_time=10.0
         )
 
-class PerplexityScraper(BaseResearchScraper):
+class PerplexityScraper(_PatchrightBase):
     """Perplexity implementation of research scraper"""
     
-    def __init__(self, config: Optional[ScraperConfig] = None):
-        super().__init__(config)
-        self.patchright = None
-        self.browser = None
-        self.page = None
+    __slots__ = ()
+    
+    def context_options(self) -> Dict[str, Any]:
+        """Get the context options for Perplexity"""
+        return dict(
+            viewport=self.config.viewport,
+            java_script_enabled=True,
+            bypass_csp=True,
+            ignore_https_errors=True,
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+        )
         
     async def setup(self) -> None:
         """Initialize Patchright browser for Perplexity"""
         logger.info("Starting Patchright browser for Perplexity...")
         try:
-            self.patchright = await async_playwright().start()
-            self.browser = await self.patchright.chromium.launch(
-                headless=self.config.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-software-rasterizer',
-                    '--disable-extensions',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-automation',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins,site-per-process'
-                ]
-            )
-            context = await self.browser.new_context(
-                viewport=self.config.viewport,
-                java_script_enabled=True,
-                bypass_csp=True,
-                ignore_https_errors=True,
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
-            )
-            
-            # Add evasion scripts
-            await context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                window.chrome = { runtime: {} };
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                    Promise.resolve({state: Notification.permission}) :
-                    originalQuery(parameters)
-                );
-            """)
-            
-            self.page = await context.new_page()
-            await self.page.goto(self.config.site_config.url)
+            await super().setup()
+            # The research flow waits for the input itself, so don't hold
+            # setup up for images, fonts and third-party scripts
+            await self.page.goto(self.config.site_config.url, wait_until='domcontentloaded', timeout=30000)
             logger.info("Browser started successfully")
         except Exception as e:
-            logger.error(f"Browser startup error: {str(e)}")
+            logger.error("Browser startup error: %s", e)
+            # Don't hand a browser in an unknown state to the next request
+            self._failed = True
             raise
 
-    async def cleanup(self) -> None:
-        """Clean up Patchright resources"""
-        if self.browser:
-            logger.info("Cleaning up resources...")
-            await self.browser.close()
-            self.browser = None
-            self.page = None
-            if self.patchright:
-                await self.patchright.stop()
-                self.patchright = None
-            logger.info("Browser stopped successfully")
-
     async def handle_site_specific_research(self, site: ResearchSite, query: str) -> str:
         """Handle research for Perplexity"""
-        if site != ResearchSite.PERPLEXITY:
+        if site is not ResearchSite.PERPLEXITY:
             raise ValueError(f"This scraper only handles Perplexity research, not {site}")
             
         try:
             # Look for input field and enter query
             logger.info("Looking for query input field...")
-            input_elem = await self.page.locator('textarea[placeholder*="Ask anything"]').first
-            if not input_elem:
-                # Try alternate placeholder text
-                input_elem = await self.page.locator('textarea[placeholder*="Message Perplexity"]').first
+            try:
+                input_elem = await self.page.wait_for_selector(
+                    'textarea[placeholder*="Ask anything"], textarea[placeholder*="Message Perplexity"]',
+                    state='visible',
+                    timeout=10000
+                )
+            except Exception:
+                input_elem = None
             
             if input_elem:
                 logger.info("Found input field, entering query...")
                 await input_elem.fill(query)
                 await input_elem.press('Enter')
                 
-                # Wait for response
+                # Wait for the response text to stop changing
                 logger.info("Waiting for response...")
-                await asyncio.sleep(15)  # Increased wait time for thorough response
-                
-                # Look for results with multiple possible selectors
-                logger.info("Looking for response content...")
-                selectors = [
-                    '.response-content',
-                    '[data-message-author-role="assistant"]',
-                    '.prose',
-                    '.markdown-content'
-                ]
-                
-                for selector in selectors:
-                    try:
-                        results = await self.page.locator(selector).text_content()
-                        if results:
-                            logger.info(f"Found results using selector: {selector}")
-                            return results
-                    except Exception:
-                        continue
+                results = await wait_for_stable_text(
+                    self.page,
+                    '.response-content, [data-message-author-role="assistant"], .prose, .markdown-content',
+                    timeout=15.0
+                )
+                if results:
+                    logger.info("Found results")
+                    return results
                 
-                logger.warning("No results found with any selector")
-                return "No results found"
+                raise RuntimeError("No results found with any selector")
             else:
                 raise RuntimeError("Query input not found")
             
         except Exception as e:
-            logger.error(f"Query submission error: {str(e)}")
+            logger.error("Query submission error: %s", e)
+            # Don't hand a browser in an unknown state to the next request
+            self._failed = True
             raise
     
     async def execute_research(self, query: str) -> str: